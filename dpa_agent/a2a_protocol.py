@@ -17,25 +17,68 @@ Behavior:
 - Messages are queued and delivered asynchronously
 - Supports request-response and event patterns
 - Message routing based on agent names
-- Message history for debugging
+- Message history for debugging (bounded to the most recent messages)
+- Optional asyncio dispatcher delivers messages as soon as they are sent
 """
 
-import json
+import asyncio
+import inspect
+import os
+import sys
+import threading
 import time
+from collections import defaultdict, deque
+from concurrent.futures import Future
 from datetime import datetime
-from enum import Enum
+from enum import IntEnum
+from itertools import count, islice
 from typing import Any, Callable, Dict, List, Optional
 
 from .utils.logging import log_event
+from .utils.serialization import json_dumps
 
+# Maximum number of messages retained in history (ring buffer capacity)
+# Design: Bounded history prevents unbounded memory growth in long sessions
+DEFAULT_HISTORY_SIZE = int(os.environ.get("DPA_A2A_HISTORY", "5000"))
 
-class MessageType(Enum):
-    """Types of A2A messages."""
+# Delivery attempts before a message for an unknown agent is parked
+MAX_DELIVERY_ATTEMPTS = 3
+# Maximum number of undeliverable messages kept while waiting for registration
+PARKING_SIZE = 1024
+# Maximum number of request futures tracked before the oldest are dropped
+PENDING_REQUESTS_SIZE = 1024
 
-    REQUEST = "request"  # Request-response pattern
-    RESPONSE = "response"  # Response to a request
-    EVENT = "event"  # Asynchronous event notification
-    BROADCAST = "broadcast"  # Broadcast to all agents
+# Next value of the monotonic sequence used to build unique message IDs
+# (bound method avoids the next() builtin lookup per message)
+_next_message_number = count(1).__next__
+
+
+class MessageType(IntEnum):
+    """
+    Types of A2A messages.
+
+    Design: IntEnum makes type comparisons plain int comparisons on the
+    dispatch path. The lowercase member name (label) is used on the wire.
+    """
+
+    REQUEST = 1  # Request-response pattern
+    RESPONSE = 2  # Response to a request
+    EVENT = 3  # Asynchronous event notification
+    BROADCAST = 4  # Broadcast to all agents
+
+    @property
+    def label(self) -> str:
+        """Serialized name of the message type (e.g. "request")."""
+        return self.name.lower()
+
+
+# Module-level aliases of the enum members for hot-path identity checks
+# Design: Enum members are singletons, so `is` avoids Enum.__eq__ and the
+# global + attribute lookup of MessageType.X on every message
+_REQUEST = MessageType.REQUEST
+_RESPONSE = MessageType.RESPONSE
+_EVENT = MessageType.EVENT
+_BROADCAST = MessageType.BROADCAST
 
 
 class A2AMessage:
@@ -48,10 +91,25 @@ class A2AMessage:
         to_agent (str): Recipient agent name (or "*" for broadcast)
         message_type (MessageType): Type of message
         payload (dict): Message payload/data
-        timestamp (datetime): When message was created
+        timestamp_ns (int): Creation time in nanoseconds since the epoch
         correlation_id (str, optional): For request-response correlation
+        retry_count (int): Failed delivery attempts (unknown recipient)
     """
 
+    # Design: __slots__ avoids a per-instance __dict__, shrinking each message
+    # retained in history and making attribute access direct slot reads
+    __slots__ = (
+        "message_id",
+        "from_agent",
+        "to_agent",
+        "message_type",
+        "payload",
+        "timestamp_ns",
+        "correlation_id",
+        "retry_count",
+        "_dict_cache",
+    )
+
     def __init__(
         self,
         from_agent: str,
@@ -70,25 +128,49 @@ class A2AMessage:
             payload (dict): Message payload
             correlation_id (str, optional): Correlation ID for request-response
         """
-        self.message_id = f"{from_agent}_{to_agent}_{int(time.time() * 1000)}"
-        self.from_agent = from_agent
-        self.to_agent = to_agent
+        # Design: Sequence-based IDs are unique even for messages created in the
+        # same millisecond and avoid float math on the send path
+        message_number = str(_next_message_number())
+        self.message_id = "_".join((from_agent, to_agent, message_number))
+        # Interned names hash/compare by identity when routed through agents dict
+        self.from_agent = sys.intern(from_agent)
+        self.to_agent = sys.intern(to_agent)
         self.message_type = message_type
         self.payload = payload
-        self.timestamp = datetime.now()
+        # Plain int timestamp; converted to datetime only when serialized
+        self.timestamp_ns = time.time_ns()
         self.correlation_id = correlation_id
+        self.retry_count = 0
+        self._dict_cache: Optional[Dict] = None
+
+    @property
+    def timestamp(self) -> datetime:
+        """When the message was created, as a local datetime."""
+        return datetime.fromtimestamp(self.timestamp_ns / 1e9)
 
     def to_dict(self) -> Dict:
-        """Convert message to dictionary."""
-        return {
+        """
+        Convert message to dictionary.
+
+        Design: Built lazily on first use and cached, since history queries
+        serialize the same messages repeatedly. Treat the result as read-only.
+        """
+        if self._dict_cache is not None:
+            return self._dict_cache
+        self._dict_cache = {
             "message_id": self.message_id,
             "from_agent": self.from_agent,
             "to_agent": self.to_agent,
-            "message_type": self.message_type.value,
+            "message_type": self.message_type.label,
             "payload": self.payload,
             "timestamp": self.timestamp.isoformat(),
             "correlation_id": self.correlation_id,
         }
+        return self._dict_cache
+
+    def to_json(self) -> str:
+        """Serialize the message to a JSON string (for transport or export)."""
+        return json_dumps(self.to_dict())
 
     @classmethod
     def from_dict(cls, data: Dict) -> "A2AMessage":
@@ -96,12 +178,13 @@ class A2AMessage:
         msg = cls(
             data["from_agent"],
             data["to_agent"],
-            MessageType(data["message_type"]),
+            MessageType[data["message_type"].upper()],
             data["payload"],
             data.get("correlation_id"),
         )
         msg.message_id = data["message_id"]
-        msg.timestamp = datetime.fromisoformat(data["timestamp"])
+        timestamp = datetime.fromisoformat(data["timestamp"])
+        msg.timestamp_ns = round(timestamp.timestamp() * 1_000_000) * 1000
         return msg
 
 
@@ -116,12 +199,42 @@ class A2AProtocol:
     protocol and messages are routed through this central broker.
     """
 
-    def __init__(self):
-        """Initialize the A2A protocol."""
+    def __init__(self, history_size: int = DEFAULT_HISTORY_SIZE):
+        """
+        Initialize the A2A protocol.
+
+        Args:
+            history_size (int): Maximum number of messages kept in history
+        """
         self.agents: Dict[str, Callable] = {}  # Agent name -> message handler
-        self.message_queue: List[A2AMessage] = []
-        self.message_history: List[A2AMessage] = []
-        self.pending_requests: Dict[str, A2AMessage] = {}  # correlation_id -> request
+        # Agent name -> delivery callable, specialized once at registration
+        self._routes: Dict[str, Callable] = {}
+        # Design: deque gives O(1) popleft for FIFO delivery (list.pop(0) is O(n))
+        self.message_queue: deque[A2AMessage] = deque()
+        # Ring buffer: oldest messages are dropped once history_size is reached
+        self.message_history: deque[A2AMessage] = deque(maxlen=history_size)
+        # Per-agent index (sent or received) for O(limit) history queries
+        self._history_by_agent: Dict[str, deque[A2AMessage]] = defaultdict(
+            lambda: deque(maxlen=history_size)
+        )
+        # correlation_id -> Future resolved with the response payload
+        # Design: concurrent.futures.Future can be waited on from sync code
+        # (result()) and from coroutines (asyncio.wrap_future)
+        self.pending_requests: Dict[str, Future] = {}
+        # Messages whose recipient is not registered yet, waiting for registration
+        self.parked_messages: deque[A2AMessage] = deque(maxlen=PARKING_SIZE)
+        # Sender -> broadcast recipients (name, handler); reset on (un)register
+        self._broadcast_recipients: Dict[str, tuple] = {}
+        # Makes taking a batch off the queue and parking/unparking messages
+        # atomic between consumers; producers never take it, and it isn't
+        # held during delivery
+        self._consumer_lock = threading.Lock()
+        # Handler tasks scheduled on a caller's event loop (see _run_coroutine)
+        self._handler_tasks: set = set()
+        # asyncio dispatcher state (see start_dispatcher)
+        self._dispatch_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._dispatch_wakeup: Optional[asyncio.Event] = None
+        self._dispatcher_task: Optional[asyncio.Task] = None
 
     def register_agent(self, agent_name: str, message_handler: Callable):
         """
@@ -131,8 +244,44 @@ class A2AProtocol:
             agent_name (str): Name of the agent
             message_handler (Callable): Function to handle incoming messages
         """
+        agent_name = sys.intern(agent_name)
         self.agents[agent_name] = message_handler
+        self._routes[agent_name] = self._specialize_handler(message_handler)
+        self._broadcast_recipients.clear()
         log_event(f"Agent {agent_name} registered with A2A protocol")
+        self.flush_parked_messages(agent_name)
+
+    def flush_parked_messages(self, agent_name: str) -> int:
+        """
+        Re-queue parked messages addressed to a newly registered agent.
+
+        Args:
+            agent_name (str): Name of the agent that became available
+
+        Returns:
+            int: Number of messages moved back to the delivery queue
+        """
+        if not self.parked_messages:
+            return 0
+
+        # Design: Consumers park messages under the consumer lock, so filtering
+        # under it keeps a concurrent process_messages() from mutating the
+        # deque mid-iteration or parking into a deque that is being replaced
+        with self._consumer_lock:
+            still_parked = deque(maxlen=PARKING_SIZE)
+            flushed = 0
+            for message in self.parked_messages:
+                if message.to_agent == agent_name:
+                    message.retry_count = 0
+                    self.message_queue.append(message)
+                    flushed += 1
+                else:
+                    still_parked.append(message)
+            self.parked_messages = still_parked
+
+        if flushed:
+            log_event(f"Re-queued {flushed} parked A2A messages for {agent_name}")
+        return flushed
 
     def unregister_agent(self, agent_name: str):
         """
@@ -143,6 +292,8 @@ class A2AProtocol:
         """
         if agent_name in self.agents:
             del self.agents[agent_name]
+            del self._routes[agent_name]
+            self._broadcast_recipients.clear()
             log_event(f"Agent {agent_name} unregistered from A2A protocol")
 
     def send_message(
@@ -174,14 +325,22 @@ class A2AProtocol:
         )
         self.message_queue.append(message)
         self.message_history.append(message)
-
-        # Store request for response correlation
-        if message_type == MessageType.REQUEST:
-            self.pending_requests[message.message_id] = message
+        self._history_by_agent[from_agent].append(message)
+        if to_agent != from_agent:
+            self._history_by_agent[to_agent].append(message)
+
+        # Register a future so the requester can wait for the response
+        if message_type is _REQUEST:
+            pending = self.pending_requests
+            pending[message.message_id] = Future()
+            # Requests nobody waits on would otherwise accumulate forever
+            if len(pending) > PENDING_REQUESTS_SIZE:
+                del pending[next(iter(pending))]
 
         log_event(
-            f"A2A message sent: {from_agent} -> {to_agent} ({message_type.value})"
+            f"A2A message sent: {from_agent} -> {to_agent} ({message_type.label})"
         )
+        self._wake_dispatcher()
         return message
 
     def send_request(
@@ -198,9 +357,58 @@ class A2AProtocol:
         Returns:
             str: Correlation ID for tracking the response
         """
-        message = self.send_message(from_agent, to_agent, MessageType.REQUEST, payload)
+        message = self.send_message(from_agent, to_agent, _REQUEST, payload)
         return message.message_id
 
+    def wait_for_response(
+        self, correlation_id: str, timeout: Optional[float] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Block until the response to a request has been dispatched.
+
+        Behavior: Messages must still be delivered, either by the asyncio
+        dispatcher or by another thread calling process_messages().
+
+        Args:
+            correlation_id (str): Correlation ID returned by send_request
+            timeout (float, optional): Maximum seconds to wait
+
+        Returns:
+            dict: Response payload, or None if unknown or timed out
+        """
+        future = self.pending_requests.get(correlation_id)
+        if future is None:
+            return None
+        try:
+            return future.result(timeout)
+        except TimeoutError:
+            return None
+        finally:
+            self.pending_requests.pop(correlation_id, None)
+
+    async def await_response(
+        self, correlation_id: str, timeout: Optional[float] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Await the response to a request from a coroutine.
+
+        Args:
+            correlation_id (str): Correlation ID returned by send_request
+            timeout (float, optional): Maximum seconds to wait
+
+        Returns:
+            dict: Response payload, or None if unknown or timed out
+        """
+        future = self.pending_requests.get(correlation_id)
+        if future is None:
+            return None
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            self.pending_requests.pop(correlation_id, None)
+
     def send_response(
         self,
         from_agent: str,
@@ -218,7 +426,7 @@ class A2AProtocol:
             correlation_id (str): Correlation ID from the original request
         """
         self.send_message(
-            from_agent, to_agent, MessageType.RESPONSE, payload, correlation_id
+            from_agent, to_agent, _RESPONSE, payload, correlation_id
         )
 
     def send_event(self, from_agent: str, to_agent: str, payload: Dict[str, Any]):
@@ -230,45 +438,204 @@ class A2AProtocol:
             to_agent (str): Recipient agent name (or "*" for broadcast)
             payload (dict): Event payload
         """
-        self.send_message(from_agent, to_agent, MessageType.EVENT, payload)
+        self.send_message(from_agent, to_agent, _EVENT, payload)
 
-    def process_messages(self):
+    def process_messages(self) -> int:
         """
         Process queued messages and deliver them to agents.
 
         Behavior: Processes all messages in the queue, routing them to
         appropriate agents based on agent name. Broadcast messages are
         delivered to all registered agents.
-        """
-        while self.message_queue:
-            message = self.message_queue.pop(0)
 
-            if message.to_agent == "*":
-                # Broadcast to all agents
-                for agent_name, handler in self.agents.items():
-                    if agent_name != message.from_agent:
+        Design: The queue is drained in batches so the inner loop runs over a
+        local tuple with locally bound lookups. Messages sent by handlers
+        during a batch are delivered in the next one.
+
+        Thread safety: Producers only append (atomic on deque, no lock). The
+        batch is taken with popleft() up to the length observed, under a lock
+        shared by consumers, so each message is taken exactly once and
+        messages appended concurrently are never lost. Delivery happens after
+        the lock is released (a handler may block waiting for a response that
+        another consumer delivers), so concurrent consumers, such as a thread
+        calling process_messages() while the asyncio dispatcher runs, can
+        deliver their batches concurrently and out of order. Use a single
+        consumer where delivery order matters.
+
+        Returns:
+            int: Number of messages processed
+        """
+        queue = self.message_queue
+        agents = self._routes
+        broadcast_recipients = self._broadcast_recipients
+        processed = 0
+
+        while queue:
+            with self._consumer_lock:
+                popleft = queue.popleft
+                batch = tuple(popleft() for _ in range(len(queue)))
+            processed += len(batch)
+
+            for message in batch:
+                # Wake whoever is waiting on this response (single dict lookup)
+                if message.message_type is _RESPONSE:
+                    future = self.pending_requests.get(message.correlation_id)
+                    if future is not None and not future.done():
+                        future.set_result(message.payload)
+
+                to_agent = message.to_agent
+                if to_agent == "*":
+                    # Broadcast to all agents except the sender
+                    # Design: Recipient tuples are cached per sender since agents
+                    # rarely (un)register once the system is running
+                    recipients = broadcast_recipients.get(message.from_agent)
+                    if recipients is None:
+                        recipients = tuple(
+                            (agent_name, handler)
+                            for agent_name, handler in agents.items()
+                            if agent_name != message.from_agent
+                        )
+                        broadcast_recipients[message.from_agent] = recipients
+                    for agent_name, handler in recipients:
                         try:
                             handler(message)
                         except Exception as e:
                             log_event(
                                 f"Error delivering broadcast message to {agent_name}: {str(e)}"
                             )
-            elif message.to_agent in self.agents:
-                # Deliver to specific agent
-                handler = self.agents[message.to_agent]
-                try:
-                    handler(message)
-                except Exception as e:
-                    log_event(
-                        f"Error delivering message to {message.to_agent}: {str(e)}"
-                    )
-            else:
-                log_event(
-                    f"Agent {message.to_agent} not found, message queued for retry"
-                )
-                # Re-queue for retry (with limit to prevent infinite loops)
-                if len(self.message_queue) < 100:
-                    self.message_queue.append(message)
+                elif (handler := agents.get(to_agent)) is not None:
+                    # Deliver to specific agent (single dict lookup)
+                    try:
+                        handler(message)
+                    except Exception as e:
+                        log_event(f"Error delivering message to {to_agent}: {str(e)}")
+                else:
+                    # Retry a bounded number of times, then park the message until
+                    # the recipient registers so it can't spin the dispatch loop
+                    message.retry_count += 1
+                    if message.retry_count < MAX_DELIVERY_ATTEMPTS:
+                        log_event(
+                            f"Agent {to_agent} not found, message queued for retry"
+                        )
+                        queue.append(message)
+                    else:
+                        log_event(
+                            f"Agent {to_agent} not found, message parked until registration"
+                        )
+                        with self._consumer_lock:  # See flush_parked_messages
+                            self.parked_messages.append(message)
+
+        if processed:
+            log_event(f"Dispatched {processed} A2A messages")
+        return processed
+
+    def _specialize_handler(self, handler: Callable) -> Callable:
+        """
+        Build the callable used to deliver messages to a handler.
+
+        Design: Whether a handler is async is decided once at registration
+        instead of inspecting every handler result on the dispatch path.
+        Plain handlers are called directly; coroutine handlers are wrapped so
+        their coroutine is scheduled (see _run_coroutine).
+
+        Args:
+            handler (Callable): Agent message handler (plain or async def)
+
+        Returns:
+            Callable: Delivery callable taking the message
+        """
+        if inspect.iscoroutinefunction(handler):
+            return lambda message: self._run_coroutine(handler(message))
+        return handler
+
+    def _run_coroutine(self, coro):
+        """
+        Run a coroutine produced by an async message handler.
+
+        Behavior: Scheduled on the dispatcher loop when it is running. Without
+        a dispatcher, a coroutine delivered from inside a running event loop
+        (e.g. an async tool calling process_messages()) becomes a task on that
+        loop, since asyncio.run() can't be nested; otherwise it is run to
+        completion.
+
+        Args:
+            coro: Coroutine returned by the handler
+        """
+        if self._dispatch_loop is not None and not self._dispatch_loop.is_closed():
+            asyncio.run_coroutine_threadsafe(coro, self._dispatch_loop)
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            asyncio.run(coro)
+            return
+        # The loop only keeps weak references to tasks, so hold on to them
+        # until they finish
+        task = loop.create_task(coro)
+        self._handler_tasks.add(task)
+        task.add_done_callback(self._handler_task_done)
+
+    def _handler_task_done(self, task: asyncio.Task):
+        """Forget a finished handler task and log its exception, if any."""
+        self._handler_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            log_event(f"Error in async message handler: {task.exception()}")
+
+    def _wake_dispatcher(self):
+        """Signal the asyncio dispatcher (if running) that messages are queued."""
+        loop = self._dispatch_loop
+        if loop is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(self._dispatch_wakeup.set)
+
+    def start_dispatcher(self) -> asyncio.Task:
+        """
+        Start delivering messages automatically on the running event loop.
+
+        Design: Instead of callers polling process_messages(), send_message()
+        wakes a dispatcher task which drains the queue immediately. The wakeup
+        is thread-safe so messages may be sent from worker threads too.
+
+        Returns:
+            asyncio.Task: The dispatcher task
+
+        Raises:
+            RuntimeError: If called without a running event loop
+        """
+        if self._dispatcher_task is not None and not self._dispatcher_task.done():
+            return self._dispatcher_task
+
+        self._dispatch_loop = asyncio.get_running_loop()
+        self._dispatch_wakeup = asyncio.Event()
+        self._dispatcher_task = self._dispatch_loop.create_task(
+            self._dispatch_forever()
+        )
+        # Deliver anything queued before the dispatcher started
+        if self.message_queue:
+            self._dispatch_wakeup.set()
+        log_event("A2A asyncio dispatcher started")
+        return self._dispatcher_task
+
+    async def stop_dispatcher(self):
+        """Stop the asyncio dispatcher and fall back to polled delivery."""
+        task = self._dispatcher_task
+        self._dispatch_loop = None
+        self._dispatch_wakeup = None
+        self._dispatcher_task = None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        log_event("A2A asyncio dispatcher stopped")
+
+    async def _dispatch_forever(self):
+        """Dispatcher task body: wait for a wakeup, then drain the queue."""
+        wakeup = self._dispatch_wakeup
+        while True:
+            await wakeup.wait()
+            wakeup.clear()
+            self.process_messages()
 
     def get_message_history(
         self, agent_name: Optional[str] = None, limit: int = 100
@@ -284,13 +651,14 @@ class A2AProtocol:
             list: List of messages
         """
         if agent_name:
-            filtered = [
-                msg
-                for msg in self.message_history
-                if msg.from_agent == agent_name or msg.to_agent == agent_name
-            ]
-            return filtered[-limit:]
-        return self.message_history[-limit:]
+            # Design: Per-agent index avoids scanning the full history
+            history = self._history_by_agent.get(agent_name)
+            if not history:
+                return []
+        else:
+            history = self.message_history
+        start = max(0, len(history) - limit)
+        return list(islice(history, start, None))
 
 
 # Global A2A protocol instance
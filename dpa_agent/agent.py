@@ -18,6 +18,8 @@ Design Decision: Multi-agent architecture allows for:
 4. Easier testing and maintenance
 """
 
+import functools
+
 from google.adk.agents import Agent
 
 from .a2a_protocol import MessageType, a2a_protocol
@@ -40,11 +42,15 @@ from .tools.long_running_tools import (
 from .tools.memory_query import get_history
 from .tools.portfolio_update import portfolio_update
 from .tools.portfolio_writer import portfolio_writer
+from .utils.logging import log_event
 
 # Import memory_bank singleton from memory module
 # This ensures all agents share the same memory instance for consistency
 # Design: Singleton pattern for memory ensures data consistency across agents
 
+# Cached enum member for identity checks in the message handlers below
+_REQUEST = MessageType.REQUEST
+
 
 def _github_agent_message_handler(message):
     """
@@ -56,9 +62,7 @@ def _github_agent_message_handler(message):
     Design: Enables agent-to-agent communication for the GitHub Analysis Agent.
     Other agents can request GitHub data by sending A2A messages.
     """
-    from .utils.logging import log_event
-
-    if message.message_type == MessageType.REQUEST:
+    if message.message_type is _REQUEST:
         # Handle request for GitHub analysis
         username = message.payload.get("username")
         if username:
@@ -81,9 +85,7 @@ def _content_agent_message_handler(message):
     This function handles A2A messages received by the Content Generation Agent.
     It processes content generation requests from other agents.
     """
-    from .utils.logging import log_event
-
-    if message.message_type == MessageType.REQUEST:
+    if message.message_type is _REQUEST:
         # Handle request for content generation
         github_summary = message.payload.get("github_summary")
         if github_summary:
@@ -106,9 +108,7 @@ def _writer_agent_message_handler(message):
     This function handles A2A messages received by the Portfolio Writer Agent.
     It processes file writing requests from other agents.
     """
-    from .utils.logging import log_event
-
-    if message.message_type == MessageType.REQUEST:
+    if message.message_type is _REQUEST:
         # Handle request for file writing
         content = message.payload.get("content")
         filename = message.payload.get("filename", "portfolio_entry.md")
@@ -129,28 +129,42 @@ def _writer_agent_message_handler(message):
 # SPECIALIZED AGENTS (Multi-Agent System)
 # ============================================================================
 
+# Design: Specialized agents are only needed when used directly (e.g. by a
+# runner), while A2A delivery goes through the message handlers. They are
+# built lazily by cached factories and exposed under their module-level names
+# via __getattr__ below, so importing this module only constructs root_agent.
+# Tool sets are immutable module-level tuples; ADK receives a list copy since
+# Agent.tools is declared as a list.
+
 # GitHub Analysis Agent
 # Purpose: Specialized agent for GitHub profile and repository analysis
 # Behavior: Focuses solely on fetching and structuring GitHub data
 # This agent can be used independently or as part of the coordinator workflow
 # A2A Integration: Registered with A2A protocol for agent-to-agent communication
-github_analysis_agent = Agent(
-    model="gemini-2.5-flash",
-    name="github_analyst",
-    description="Specialized agent for GitHub profile and repository analysis",
-    instruction=(
-        "You are a GitHub analysis specialist. Your role is to fetch and analyze "
-        "GitHub profiles and repositories. Focus on extracting meaningful insights "
-        "from developer activity, commit history, and repository metadata. "
-        "Provide structured, accurate data for portfolio generation. "
-        "You can communicate with other agents via the A2A protocol."
-    ),
-    tools=[
-        github_analyzer,  # Fetches basic profile data
-        github_repo_activity,  # Analyzes repository commits and activity
-    ],
+_GITHUB_ANALYST_TOOLS = (
+    github_analyzer,  # Fetches basic profile data
+    github_repo_activity,  # Analyzes repository commits and activity
 )
 
+
+@functools.cache
+def get_github_analysis_agent() -> Agent:
+    """Build the GitHub Analysis Agent on first use."""
+    return Agent(
+        model="gemini-2.5-flash",
+        name="github_analyst",
+        description="Specialized agent for GitHub profile and repository analysis",
+        instruction=(
+            "You are a GitHub analysis specialist. Your role is to fetch and analyze "
+            "GitHub profiles and repositories. Focus on extracting meaningful insights "
+            "from developer activity, commit history, and repository metadata. "
+            "Provide structured, accurate data for portfolio generation. "
+            "You can communicate with other agents via the A2A protocol."
+        ),
+        tools=list(_GITHUB_ANALYST_TOOLS),
+    )
+
+
 # Register GitHub agent with A2A protocol
 # Design: Enables agent-to-agent communication for GitHub analysis requests
 a2a_protocol.register_agent("github_analyst", _github_agent_message_handler)
@@ -161,23 +175,30 @@ a2a_protocol.register_agent("github_analyst", _github_agent_message_handler)
 # Behavior: Takes structured GitHub data and generates professional content
 # Design: Uses model fallback mechanism to support both free and pro API tiers
 # A2A Integration: Registered with A2A protocol for agent-to-agent communication
-content_generation_agent = Agent(
-    model="gemini-2.5-flash",
-    name="content_generator_agent",
-    description="Specialized agent for generating portfolio content using AI",
-    instruction=(
-        "You are a content generation specialist. Your role is to transform "
-        "GitHub data into engaging, professional portfolio content. Generate "
-        "content in various formats (LinkedIn posts, blog posts, README files) "
-        "with appropriate tone and style. Ensure content is accurate, engaging, "
-        "and highlights the developer's achievements effectively. "
-        "You can communicate with other agents via the A2A protocol."
-    ),
-    tools=[
-        content_generator,  # Uses Gemini to generate content
-    ],
+_CONTENT_GENERATOR_TOOLS = (
+    content_generator,  # Uses Gemini to generate content
 )
 
+
+@functools.cache
+def get_content_generation_agent() -> Agent:
+    """Build the Content Generation Agent on first use."""
+    return Agent(
+        model="gemini-2.5-flash",
+        name="content_generator_agent",
+        description="Specialized agent for generating portfolio content using AI",
+        instruction=(
+            "You are a content generation specialist. Your role is to transform "
+            "GitHub data into engaging, professional portfolio content. Generate "
+            "content in various formats (LinkedIn posts, blog posts, README files) "
+            "with appropriate tone and style. Ensure content is accurate, engaging, "
+            "and highlights the developer's achievements effectively. "
+            "You can communicate with other agents via the A2A protocol."
+        ),
+        tools=list(_CONTENT_GENERATOR_TOOLS),
+    )
+
+
 # Register Content agent with A2A protocol
 # Design: Enables agent-to-agent communication for content generation requests
 a2a_protocol.register_agent("content_generator_agent", _content_agent_message_handler)
@@ -188,21 +209,29 @@ a2a_protocol.register_agent("content_generator_agent", _content_agent_message_ha
 # Behavior: Handles writing content to files and managing portfolio entries
 # Design: Separated from content generation to allow for different output formats
 # A2A Integration: Registered with A2A protocol for agent-to-agent communication
-portfolio_writer_agent = Agent(
-    model="gemini-2.5-flash",
-    name="portfolio_writer_agent",
-    description="Specialized agent for writing and managing portfolio files",
-    instruction=(
-        "You are a portfolio management specialist. Your role is to save generated "
-        "content to appropriate files, manage portfolio entries, and ensure "
-        "proper formatting. Handle file operations safely with proper error handling. "
-        "You can communicate with other agents via the A2A protocol."
-    ),
-    tools=[
-        portfolio_writer,  # Writes content to markdown files
-    ],
+_PORTFOLIO_WRITER_TOOLS = (
+    portfolio_writer,  # Writes content to markdown files
 )
 
+
+@functools.cache
+def get_portfolio_writer_agent() -> Agent:
+    """Build the Portfolio Writer Agent on first use."""
+    return Agent(
+        model="gemini-2.5-flash",
+        name="portfolio_writer_agent",
+        description="Specialized agent for writing and managing portfolio files",
+        instruction=(
+            "You are a portfolio management specialist. Your role is to save generated "
+            "content to appropriate files, manage portfolio entries, and ensure "
+            "proper formatting. Handle file operations safely with proper error "
+            "handling. "
+            "You can communicate with other agents via the A2A protocol."
+        ),
+        tools=list(_PORTFOLIO_WRITER_TOOLS),
+    )
+
+
 # Register Writer agent with A2A protocol
 # Design: Enables agent-to-agent communication for file writing requests
 a2a_protocol.register_agent("portfolio_writer_agent", _writer_agent_message_handler)
@@ -218,6 +247,27 @@ a2a_protocol.register_agent("portfolio_writer_agent", _writer_agent_message_hand
 # Design: Uses sequential agent pattern - delegates to specialized agents in order
 # This agent has access to all tools and can coordinate the full workflow
 # A2A Integration: Can communicate with specialized agents via A2A protocol
+_ROOT_TOOLS = (
+    # Direct tool access for coordinator
+    github_analyzer,
+    github_repo_activity,
+    content_generator,
+    portfolio_writer,
+    portfolio_update,  # Complete workflow tool
+    get_history,  # Memory query tool
+    # A2A Protocol tools for agent-to-agent communication
+    send_a2a_request,  # Send requests to other agents
+    send_a2a_event,  # Send events to other agents
+    get_a2a_message_history,  # Query A2A message history
+    process_a2a_messages,  # Process queued messages
+    # Long-running operation tools
+    create_long_running_operation,  # Create pauseable operations
+    pause_operation,  # Pause an operation
+    resume_operation,  # Resume a paused operation
+    get_operation_status,  # Check operation status
+    list_operations,  # List all operations
+)
+
 root_agent = Agent(
     model="gemini-2.5-flash",
     name="dpa_root",
@@ -237,26 +287,7 @@ root_agent = Agent(
         "Ensure error handling and provide clear feedback to users. "
         "Maintain awareness of the workflow state and handle failures gracefully."
     ),
-    tools=[
-        # Direct tool access for coordinator
-        github_analyzer,
-        github_repo_activity,
-        content_generator,
-        portfolio_writer,
-        portfolio_update,  # Complete workflow tool
-        get_history,  # Memory query tool
-        # A2A Protocol tools for agent-to-agent communication
-        send_a2a_request,  # Send requests to other agents
-        send_a2a_event,  # Send events to other agents
-        get_a2a_message_history,  # Query A2A message history
-        process_a2a_messages,  # Process queued messages
-        # Long-running operation tools
-        create_long_running_operation,  # Create pauseable operations
-        pause_operation,  # Pause an operation
-        resume_operation,  # Resume a paused operation
-        get_operation_status,  # Check operation status
-        list_operations,  # List all operations
-    ],
+    tools=list(_ROOT_TOOLS),
 )
 
 
@@ -264,11 +295,25 @@ root_agent = Agent(
 # Design: Enables coordinator to send requests to specialized agents
 def _coordinator_message_handler(message):
     """Handle messages received by the coordinator agent."""
-    from .utils.logging import log_event
-
     log_event(
-        f"Coordinator agent received A2A message: {message.message_type.value} from {message.from_agent}"
+        f"Coordinator agent received A2A message: {message.message_type.label} from {message.from_agent}"
     )
 
 
 a2a_protocol.register_agent("dpa_root", _coordinator_message_handler)
+
+
+# Lazily constructed module attributes (PEP 562)
+_LAZY_AGENTS = {
+    "github_analysis_agent": get_github_analysis_agent,
+    "content_generation_agent": get_content_generation_agent,
+    "portfolio_writer_agent": get_portfolio_writer_agent,
+}
+
+
+def __getattr__(name):
+    """Resolve specialized agents on first attribute access."""
+    factory = _LAZY_AGENTS.get(name)
+    if factory is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return factory()
@@ -17,11 +17,62 @@ Behavior:
 - Supports different compaction strategies
 """
 
-from datetime import datetime
+import heapq
+import time
+from dataclasses import dataclass, field
+from itertools import count, islice
 from typing import Any, Dict, List, Optional
 
 from .utils.logging import log_event
 
+# Marker appended to entries shortened by summarization
+_SUMMARY_SUFFIX = "... [summarized]"
+# Number of leading characters kept when an entry is summarized
+_SUMMARY_PREFIX_CHARS = 100
+
+
+def estimate_tokens(content: str) -> int:
+    """
+    Estimate the token count of a string.
+
+    Design: Rough approximation of 1 token ≈ 3 characters. The estimate is
+    computed once per entry and cached on ContextEntry.tokens.
+
+    Args:
+        content (str): Text to estimate
+
+    Returns:
+        int: Estimated token count
+    """
+    return len(content) // 3
+
+
+@dataclass(slots=True)
+class ContextEntry:
+    """
+    A single context entry.
+
+    Design: Slotted dataclass instead of a per-entry dict, which keeps large
+    histories compact and makes field access cheaper in compaction scans.
+
+    Attributes:
+        id (int): Sequence number, stable across compaction
+        content (str): Entry text
+        role (str): Role ("user", "assistant", "system")
+        importance (int): Importance score (1-10)
+        tokens (int): Cached token estimate for content
+        timestamp_ns (int): Creation time in epoch ns; format only when displayed
+        metadata (dict): Additional metadata
+    """
+
+    id: int
+    content: str
+    role: str
+    importance: int
+    tokens: int
+    timestamp_ns: int
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
 
 class ContextManager:
     """
@@ -33,13 +84,18 @@ class ContextManager:
 
     Attributes:
         max_tokens (int): Maximum tokens allowed in context
+        max_entries (int): Maximum number of entries kept in context
         current_tokens (int): Current token count
-        context_history (list): History of context entries
+        context_history (list): History of context entries (oldest first)
         compaction_strategy (str): Current compaction strategy
+        important_entries (set): Sequence numbers of entries to preserve
     """
 
     def __init__(
-        self, max_tokens: int = 32000, compaction_strategy: str = "importance"
+        self,
+        max_tokens: int = 32000,
+        compaction_strategy: str = "importance",
+        max_entries: int = 10_000,
     ):
         """
         Initialize the context manager.
@@ -47,12 +103,58 @@ class ContextManager:
         Args:
             max_tokens (int): Maximum tokens in context window
             compaction_strategy (str): Strategy to use ("importance", "summarize", "truncate")
+            max_entries (int): Maximum number of entries kept, regardless of
+                tokens (many tiny entries could otherwise grow without bound)
+
+        Raises:
+            ValueError: If compaction_strategy is unknown
         """
         self.max_tokens = max_tokens
+        self.max_entries = max_entries
         self.current_tokens = 0
-        self.context_history: List[Dict[str, Any]] = []
-        self.compaction_strategy = compaction_strategy
-        self.important_entries: set = set()  # Track important entries to preserve
+        self.compaction_strategy = compaction_strategy  # Resolved by the setter
+        # Entries keyed by a monotonic sequence number (dicts keep insertion
+        # order, so iteration is oldest first). Sequence numbers stay valid
+        # when other entries are removed and allow O(1) deletion.
+        self._entries: Dict[int, ContextEntry] = {}
+        self._next_seq = count()
+        # Track important entries to preserve, by sequence number
+        self.important_entries: set = set()
+        # Min-heap of (importance, seq) for entries eligible for importance
+        # compaction, so the least important entries are found in O(log n)
+        self._importance_heap: List[tuple] = []
+        # Cached get_context() messages; extended on append, dropped (None)
+        # whenever entries are removed or rewritten
+        self._llm_view: Optional[List[Dict[str, str]]] = None
+
+    @property
+    def compaction_strategy(self) -> str:
+        """Name of the active compaction strategy."""
+        return self._compaction_strategy
+
+    @compaction_strategy.setter
+    def compaction_strategy(self, strategy: str):
+        """
+        Set the compaction strategy, resolving it to a bound method once.
+
+        Design: compact_context calls the resolved method directly instead of
+        comparing strategy names on every compaction, and unknown strategies
+        fail fast here rather than at the first compaction.
+        """
+        compactors = {
+            "importance": self._compact_by_importance,
+            "summarize": self._compact_by_summarization,
+            "truncate": self._compact_by_truncation,
+        }
+        if strategy not in compactors:
+            raise ValueError(f"Unknown compaction strategy: {strategy}")
+        self._compaction_strategy = strategy
+        self._compactor = compactors[strategy]
+
+    @property
+    def context_history(self) -> List[ContextEntry]:
+        """History of context entries, oldest first."""
+        return list(self._entries.values())
 
     def add_context(
         self,
@@ -76,8 +178,8 @@ class ContextManager:
         Returns:
             bool: True if added successfully, False if compaction failed
         """
-        # Estimate tokens (rough approximation: 1 token ≈ 4 characters)
-        estimated_tokens = len(content) // 4
+        # Estimate tokens once; cached on the entry so compaction never recomputes
+        estimated_tokens = estimate_tokens(content)
 
         # Check if we need to compact
         if self.current_tokens + estimated_tokens > self.max_tokens:
@@ -85,26 +187,123 @@ class ContextManager:
                 log_event("Context compaction failed, cannot add new content")
                 return False
 
-        entry = {
-            "content": content,
-            "role": role,
-            "importance": importance,
-            "tokens": estimated_tokens,
-            "timestamp": datetime.now().isoformat(),
-            "metadata": metadata or {},
-        }
-
-        self.context_history.append(entry)
+        self._append_entry(
+            content, role, importance, estimated_tokens, time.time_ns(), metadata
+        )
         self.current_tokens += estimated_tokens
+        self._enforce_entry_limit()
 
-        if importance >= 8:
-            self.important_entries.add(len(self.context_history) - 1)
+        log_event(
+            "Added context: %d tokens, total: %d/%d",
+            estimated_tokens,
+            self.current_tokens,
+            self.max_tokens,
+        )
+        return True
+
+    def add_contexts(self, messages: List[Dict[str, Any]]) -> bool:
+        """
+        Add several messages (e.g. a whole conversation turn) at once.
+
+        Behavior: Makes one compaction decision for the combined token count,
+        stamps all entries with one timestamp and logs once. Either all
+        messages are added or none are.
+
+        Args:
+            messages (list): Dicts with a "content" key and optional "role",
+                "importance" and "metadata" keys (same meaning and defaults
+                as the add_context arguments)
+
+        Returns:
+            bool: True if added successfully, False if compaction failed
+        """
+        token_counts = [estimate_tokens(message["content"]) for message in messages]
+        total_tokens = sum(token_counts)
+
+        # Single compaction check for the whole batch
+        if self.current_tokens + total_tokens > self.max_tokens:
+            if not self.compact_context(total_tokens):
+                log_event("Context compaction failed, cannot add new content")
+                return False
+
+        timestamp_ns = time.time_ns()
+        for message, tokens in zip(messages, token_counts):
+            self._append_entry(
+                message["content"],
+                message.get("role", "user"),
+                message.get("importance", 1),
+                tokens,
+                timestamp_ns,
+                message.get("metadata"),
+            )
+        self.current_tokens += total_tokens
+        self._enforce_entry_limit()
 
         log_event(
-            f"Added context: {estimated_tokens} tokens, total: {self.current_tokens}/{self.max_tokens}"
+            "Added %d context entries: %d tokens, total: %d/%d",
+            len(messages),
+            total_tokens,
+            self.current_tokens,
+            self.max_tokens,
         )
         return True
 
+    def _append_entry(
+        self,
+        content: str,
+        role: str,
+        importance: int,
+        tokens: int,
+        timestamp_ns: int,
+        metadata: Optional[Dict],
+    ):
+        """
+        Store a new entry and index it for compaction.
+
+        Callers are responsible for updating current_tokens.
+        """
+        seq = next(self._next_seq)
+        self._entries[seq] = ContextEntry(
+            seq, content, role, importance, tokens, timestamp_ns, metadata or {}
+        )
+
+        if self._llm_view is not None:
+            self._llm_view.append({"role": role, "content": content})
+
+        if importance >= 8:
+            self.important_entries.add(seq)
+        elif importance < 5:
+            heapq.heappush(self._importance_heap, (importance, seq))
+
+    def _enforce_entry_limit(self):
+        """
+        Drop the oldest non-important entries while above max_entries.
+
+        Design: Token-based compaction alone never bounds the entry count
+        (e.g. "summarize" keeps every entry), so the cap is enforced here
+        independently of the compaction strategy.
+        """
+        excess = len(self._entries) - self.max_entries
+        if excess <= 0:
+            return
+
+        entries_to_remove = []
+        for seq in self._entries:
+            if seq not in self.important_entries:
+                entries_to_remove.append(seq)
+                if len(entries_to_remove) >= excess:
+                    break
+        if not entries_to_remove:
+            return  # Only important entries left; nothing can be dropped
+
+        for seq in entries_to_remove:
+            self.current_tokens -= self._entries.pop(seq).tokens
+        self._prune_importance_heap()
+        self._llm_view = None
+        log_event(
+            "Context entry limit reached: dropped %d entries", len(entries_to_remove)
+        )
+
     def compact_context(self, required_tokens: int) -> bool:
         """
         Compact the context to make room for new content.
@@ -118,22 +317,18 @@ class ContextManager:
         Returns:
             bool: True if compaction successful, False otherwise
         """
-        if self.compaction_strategy == "importance":
-            return self._compact_by_importance(required_tokens)
-        elif self.compaction_strategy == "summarize":
-            return self._compact_by_summarization(required_tokens)
-        elif self.compaction_strategy == "truncate":
-            return self._compact_by_truncation(required_tokens)
-        else:
-            log_event(f"Unknown compaction strategy: {self.compaction_strategy}")
-            return False
+        # Every strategy removes or rewrites entries, even when it fails
+        self._llm_view = None
+        return self._compactor(required_tokens)
 
     def _compact_by_importance(self, required_tokens: int) -> bool:
         """
         Compact by removing least important entries.
 
         Design: Preserves entries marked as important and removes others
-        starting with the lowest importance scores.
+        starting with the lowest importance scores. Candidates are selected
+        from the compact (importance, seq) heap, so only the popped entries
+        are touched (for their token count); contents are never scanned.
 
         Args:
             required_tokens (int): Tokens needed
@@ -141,27 +336,23 @@ class ContextManager:
         Returns:
             bool: True if successful
         """
-        # Sort by importance (lowest first), but preserve important entries
-        entries_to_remove = []
+        # Pop the least important entries (oldest first on ties) from the heap
+        # Only entries with importance < 5 are ever pushed, so important
+        # entries are never candidates
+        heap = self._importance_heap
+        entries = self._entries
         tokens_to_free = 0
 
-        for i, entry in enumerate(self.context_history):
-            if i not in self.important_entries and entry["importance"] < 5:
-                entries_to_remove.append(i)
-                tokens_to_free += entry["tokens"]
-                if tokens_to_free >= required_tokens:
-                    break
+        while heap and tokens_to_free < required_tokens:
+            _, seq = heapq.heappop(heap)
+            entry = entries.pop(seq, None)
+            if entry is None:
+                continue  # Stale: already removed by another strategy
+            tokens_to_free += entry.tokens
 
-        # Remove entries in reverse order to maintain indices
-        for i in reversed(entries_to_remove):
-            self.current_tokens -= self.context_history[i]["tokens"]
-            self.context_history.pop(i)
-            # Update important_entries indices
-            self.important_entries = {
-                idx - 1 if idx > i else idx for idx in self.important_entries
-            }
+        self.current_tokens -= tokens_to_free
 
-        log_event(f"Compacted context by importance: freed {tokens_to_free} tokens")
+        log_event("Compacted context by importance: freed %d tokens", tokens_to_free)
         return tokens_to_free >= required_tokens
 
     def _compact_by_summarization(self, required_tokens: int) -> bool:
@@ -179,27 +370,27 @@ class ContextManager:
         """
         # Summarize older entries (keep recent ones intact)
         tokens_freed = 0
-        entries_to_summarize = len(self.context_history) // 2  # Summarize older half
+        entries_to_summarize = len(self._entries) // 2  # Summarize older half
 
-        for i in range(entries_to_summarize):
-            if i in self.important_entries:
+        for seq, entry in islice(self._entries.items(), entries_to_summarize):
+            if seq in self.important_entries:
                 continue  # Don't summarize important entries
 
-            entry = self.context_history[i]
-            original_tokens = entry["tokens"]
-
             # Simple summarization: take first 100 chars + "..."
-            if len(entry["content"]) > 100:
-                entry["content"] = entry["content"][:100] + "... [summarized]"
-                new_tokens = len(entry["content"]) // 4
-                tokens_freed += original_tokens - new_tokens
-                entry["tokens"] = new_tokens
-                self.current_tokens -= original_tokens - new_tokens
+            content = entry.content
+            if len(content) > _SUMMARY_PREFIX_CHARS:
+                new_content = content[:_SUMMARY_PREFIX_CHARS] + _SUMMARY_SUFFIX
+                delta = entry.tokens - estimate_tokens(new_content)
+                entry.content = new_content
+                entry.tokens -= delta
+                tokens_freed += delta
 
             if tokens_freed >= required_tokens:
                 break
 
-        log_event(f"Compacted context by summarization: freed {tokens_freed} tokens")
+        # Single bookkeeping update for everything freed above
+        self.current_tokens -= tokens_freed
+        log_event("Compacted context by summarization: freed %d tokens", tokens_freed)
         return tokens_freed >= required_tokens
 
     def _compact_by_truncation(self, required_tokens: int) -> bool:
@@ -219,47 +410,65 @@ class ContextManager:
         entries_to_remove = []
 
         # Remove oldest entries (but preserve important ones)
-        for i, entry in enumerate(self.context_history):
-            if i not in self.important_entries:
-                entries_to_remove.append(i)
-                tokens_freed += entry["tokens"]
+        for seq, entry in self._entries.items():
+            if seq not in self.important_entries:
+                entries_to_remove.append(seq)
+                tokens_freed += entry.tokens
                 if tokens_freed >= required_tokens:
                     break
 
-        # Remove entries in reverse order
-        for i in reversed(entries_to_remove):
-            self.current_tokens -= self.context_history[i]["tokens"]
-            self.context_history.pop(i)
-            # Update important_entries indices
-            self.important_entries = {
-                idx - 1 if idx > i else idx for idx in self.important_entries
-            }
+        # Deleting by key is O(1) each; stale heap items are skipped lazily
+        for seq in entries_to_remove:
+            del self._entries[seq]
+        self.current_tokens -= tokens_freed
+        self._prune_importance_heap()
 
-        log_event(f"Compacted context by truncation: freed {tokens_freed} tokens")
+        log_event("Compacted context by truncation: freed %d tokens", tokens_freed)
         return tokens_freed >= required_tokens
 
-    def get_context(self, format_for_llm: bool = True) -> List[Dict[str, Any]]:
+    def _prune_importance_heap(self):
+        """
+        Drop stale heap items once they outnumber the live entries.
+
+        Design: Entries removed outside importance compaction are deleted
+        lazily from the heap; rebuilding occasionally keeps it bounded.
+        """
+        heap = self._importance_heap
+        if len(heap) > 2 * len(self._entries) + 16:
+            entries = self._entries
+            self._importance_heap = [item for item in heap if item[1] in entries]
+            heapq.heapify(self._importance_heap)
+
+    def get_context(self, format_for_llm: bool = True) -> List[Any]:
         """
         Get the current context, optionally formatted for LLM.
 
+        Design: The LLM messages are cached between calls and only rebuilt
+        after compaction, so a turn without compaction returns a copy of the
+        cached list instead of allocating a dict per entry.
+
         Args:
             format_for_llm (bool): Format as messages for LLM API
 
         Returns:
-            list: Context entries or formatted messages
+            list: ContextEntry objects or formatted message dicts
         """
         if format_for_llm:
-            return [
-                {"role": entry["role"], "content": entry["content"]}
-                for entry in self.context_history
-            ]
+            if self._llm_view is None:
+                self._llm_view = [
+                    {"role": entry.role, "content": entry.content}
+                    for entry in self._entries.values()
+                ]
+            return list(self._llm_view)
         return self.context_history
 
     def clear_context(self):
         """Clear all context."""
-        self.context_history = []
+        self._entries = {}
         self.current_tokens = 0
         self.important_entries = set()
+        self._importance_heap = []
+        self._llm_view = None
         log_event("Context cleared")
 
     def get_context_stats(self) -> Dict[str, Any]:
@@ -273,7 +482,7 @@ class ContextManager:
             "current_tokens": self.current_tokens,
             "max_tokens": self.max_tokens,
             "usage_percent": (self.current_tokens / self.max_tokens) * 100,
-            "entries_count": len(self.context_history),
+            "entries_count": len(self._entries),
             "important_entries": len(self.important_entries),
             "compaction_strategy": self.compaction_strategy,
         }
@@ -16,12 +16,116 @@ Behavior:
 - Provides evaluation summaries for agent performance analysis
 """
 
+import functools
+import re
+import threading
 import time
+from collections import deque
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
 
 from .memory import PersistentMemoryBank
 
+# Maximum number of per-operation performance records kept in memory
+PERFORMANCE_HISTORY_SIZE = 10_000
+# Maximum number of content quality records kept in memory
+CONTENT_QUALITY_HISTORY_SIZE = 1000
+
+# Single-pass scan for the completeness features: hashtags, links and
+# (case-insensitive) engagement keywords, one capture group each
+_QUALITY_RE = re.compile(r"(#)|(http|github\.com)|((?i:check|see|view|explore))")
+
+
+class PerformanceRecord(NamedTuple):
+    """
+    A single timed operation.
+
+    Design: A tuple instead of a per-record dict keeps the 10k-record history
+    compact and cheap to append; fields are still readable by name.
+    """
+
+    operation: str
+    time: float
+    success: bool
+
+
+@functools.lru_cache(maxsize=1024)
+def _scan_content(content: str) -> tuple:
+    """
+    Scan content for the features used by quality scoring.
+
+    Design: Cached by content so re-evaluating the same text (retries,
+    re-scoring) skips the string scans entirely.
+
+    Args:
+        content (str): Content to scan
+
+    Returns:
+        tuple: (length, word_count, has_hashtags, has_links, has_engagement)
+    """
+    # One scan over the content in C; stop once every feature has been seen
+    found = [False, False, False, False]  # Index 0 unused (groups are 1-based)
+    for match in _QUALITY_RE.finditer(content):
+        found[match.lastindex] = True
+        if found[1] and found[2] and found[3]:
+            break
+    # Design: str.split() is kept for word_count. It is exact for any
+    # whitespace and faster than a regex word iterator; count(" ") would
+    # miscount newlines and repeated spaces, which generated posts contain
+    word_count = len(content.split())
+    return (len(content), word_count, found[1], found[2], found[3])
+
+
+def _score_content(content: str, min_length: int, max_length: int) -> dict:
+    """
+    Compute the quality score and metrics for a single content.
+
+    Design: Uses simple heuristics for evaluation. In a production system,
+    this could use more sophisticated NLP metrics or LLM-based evaluation.
+
+    Args:
+        content (str): Generated content to evaluate
+        min_length (int): Minimum expected content length
+        max_length (int): Maximum expected content length
+
+    Returns:
+        dict: Quality metrics (without timestamp)
+    """
+    length, word_count, has_hashtags, has_links, has_engagement = _scan_content(
+        content
+    )
+
+    # Calculate quality score (0-100)
+    # Length score: optimal range gets full points
+    if min_length <= length <= max_length:
+        length_score = 100
+    elif length < min_length:
+        length_score = (length / min_length) * 50  # Partial credit
+    else:
+        length_score = max(0, 100 - ((length - max_length) / max_length) * 50)
+
+    # Completeness: check for key elements (computed by _scan_content)
+    completeness_score = 0
+    if has_hashtags:
+        completeness_score += 25
+    if has_links:
+        completeness_score += 25
+    if has_engagement:
+        completeness_score += 25
+    if word_count > 50:  # Substantial content
+        completeness_score += 25
+
+    quality_score = (length_score * 0.5) + (completeness_score * 0.5)
+
+    return {
+        "score": round(quality_score, 2),
+        "length": length,
+        "word_count": word_count,
+        "has_hashtags": has_hashtags,
+        "has_links": has_links,
+        "has_engagement": has_engagement,
+    }
+
 
 class AgentEvaluator:
     """
@@ -49,9 +153,17 @@ class AgentEvaluator:
             "successful_operations": 0,
             "failed_operations": 0,
             "tool_usage": {},  # Track usage per tool
-            "content_quality": [],  # Track content quality metrics
-            "performance": [],  # Track execution times
+            # Recent content quality metrics (bounded); averages use running sums
+            "content_quality": deque(maxlen=CONTENT_QUALITY_HISTORY_SIZE),
+            # Recent execution times (bounded); averages use running sums below
+            "performance": deque(maxlen=PERFORMANCE_HISTORY_SIZE),
         }
+        # Running execution-time totals across all operations
+        self._time_sum = 0.0
+        self._time_count = 0
+        # Running content quality score totals
+        self._quality_sum = 0.0
+        self._quality_count = 0
 
     def record_operation(
         self,
@@ -72,37 +184,65 @@ class AgentEvaluator:
             execution_time (float, optional): Execution time in seconds
             metadata (dict, optional): Additional metadata about the operation
         """
-        self.metrics["total_operations"] += 1
+        self.record_operations(((operation_type, success, execution_time),))
 
-        if success:
-            self.metrics["successful_operations"] += 1
-        else:
-            self.metrics["failed_operations"] += 1
-
-        # Track tool usage
-        if operation_type not in self.metrics["tool_usage"]:
-            self.metrics["tool_usage"][operation_type] = {
-                "total": 0,
-                "success": 0,
-                "failure": 0,
-            }
-
-        self.metrics["tool_usage"][operation_type]["total"] += 1
-        if success:
-            self.metrics["tool_usage"][operation_type]["success"] += 1
-        else:
-            self.metrics["tool_usage"][operation_type]["failure"] += 1
-
-        # Track performance
-        if execution_time is not None:
-            self.metrics["performance"].append(
-                {
-                    "operation": operation_type,
-                    "time": execution_time,
-                    "success": success,
-                    "timestamp": datetime.now().isoformat(),
+    def record_operations(
+        self, operations: Iterable[Tuple[str, bool, Optional[float]]]
+    ):
+        """
+        Record several agent operations at once.
+
+        Behavior: Same effect as calling record_operation for each
+        (operation_type, success, execution_time) tuple, e.g. the steps of one
+        workflow collected and recorded together when it finishes.
+
+        Design: Lookups are hoisted out of the loop and the overall counters
+        are updated once per batch.
+
+        Args:
+            operations (iterable): (operation_type, success, execution_time)
+                tuples; execution_time may be None
+        """
+        metrics = self.metrics
+        tool_usage = metrics["tool_usage"]
+        performance = metrics["performance"]
+        count = 0
+        successes = 0
+
+        for operation_type, success, execution_time in operations:
+            count += 1
+            if success:
+                successes += 1
+
+            # Track tool usage
+            # Design: One lookup binds the per-tool counters; the success flag
+            # selects the counter key instead of branching
+            tool_metrics = tool_usage.get(operation_type)
+            if tool_metrics is None:
+                tool_metrics = tool_usage[operation_type] = {
+                    "total": 0,
+                    "success": 0,
+                    "failure": 0,
+                    "time_sum": 0.0,  # Running execution-time total for averages
+                    "time_count": 0,
                 }
-            )
+
+            tool_metrics["total"] += 1
+            tool_metrics["success" if success else "failure"] += 1
+
+            # Track performance
+            if execution_time is not None:
+                tool_metrics["time_sum"] += execution_time
+                tool_metrics["time_count"] += 1
+                self._time_sum += execution_time
+                self._time_count += 1
+                performance.append(
+                    PerformanceRecord(operation_type, execution_time, success)
+                )
+
+        metrics["total_operations"] += count
+        metrics["successful_operations"] += successes
+        metrics["failed_operations"] += count - successes
 
     def evaluate_content_quality(
         self, content: str, min_length: int = 100, max_length: int = 2000
@@ -113,9 +253,6 @@ class AgentEvaluator:
         Behavior: Analyzes content for quality metrics including length,
         completeness, and structure. Returns a quality score and metrics.
 
-        Design: Uses simple heuristics for evaluation. In a production system,
-        this could use more sophisticated NLP metrics or LLM-based evaluation.
-
         Args:
             content (str): Generated content to evaluate
             min_length (int): Minimum expected content length
@@ -124,50 +261,45 @@ class AgentEvaluator:
         Returns:
             dict: Quality metrics including score, length, completeness
         """
-        length = len(content)
-        word_count = len(content.split())
-
-        # Calculate quality score (0-100)
-        # Length score: optimal range gets full points
-        if min_length <= length <= max_length:
-            length_score = 100
-        elif length < min_length:
-            length_score = (length / min_length) * 50  # Partial credit
-        else:
-            length_score = max(0, 100 - ((length - max_length) / max_length) * 50)
-
-        # Completeness: check for key elements
-        has_hashtags = "#" in content
-        has_links = "http" in content or "github.com" in content
-        has_engagement = any(
-            word in content.lower() for word in ["check", "see", "view", "explore"]
-        )
-
-        completeness_score = 0
-        if has_hashtags:
-            completeness_score += 25
-        if has_links:
-            completeness_score += 25
-        if has_engagement:
-            completeness_score += 25
-        if word_count > 50:  # Substantial content
-            completeness_score += 25
-
-        quality_score = (length_score * 0.5) + (completeness_score * 0.5)
-
-        quality_metrics = {
-            "score": round(quality_score, 2),
-            "length": length,
-            "word_count": word_count,
-            "has_hashtags": has_hashtags,
-            "has_links": has_links,
-            "has_engagement": has_engagement,
-            "timestamp": datetime.now().isoformat(),
-        }
+        quality_metrics = _score_content(content, min_length, max_length)
+        # Integer epoch nanoseconds: no datetime allocation per evaluation
+        quality_metrics["timestamp_ns"] = time.time_ns()
 
         self.metrics["content_quality"].append(quality_metrics)
+        self._quality_sum += quality_metrics["score"]
+        self._quality_count += 1
         return quality_metrics
 
+    def evaluate_content_quality_batch(
+        self, contents: List[str], min_length: int = 100, max_length: int = 2000
+    ) -> List[Dict[str, any]]:
+        """
+        Evaluate the quality of several generated candidates at once.
+
+        Behavior: Scores each content exactly like evaluate_content_quality,
+        e.g. when ranking candidates, but records the whole batch with one
+        timestamp and a single update of the running totals.
+
+        Args:
+            contents (list): Generated contents to evaluate
+            min_length (int): Minimum expected content length
+            max_length (int): Maximum expected content length
+
+        Returns:
+            list: Quality metrics for each content, in input order
+        """
+        timestamp_ns = time.time_ns()
+        results = []
+        for content in contents:
+            quality_metrics = _score_content(content, min_length, max_length)
+            quality_metrics["timestamp_ns"] = timestamp_ns
+            results.append(quality_metrics)
+
+        self.metrics["content_quality"].extend(results)
+        self._quality_sum += sum(metrics["score"] for metrics in results)
+        self._quality_count += len(results)
+        return results
+
     def get_success_rate(self) -> float:
         """
         Calculate overall success rate.
@@ -206,25 +338,27 @@ class AgentEvaluator:
         """
         Get average execution time for operations.
 
+        Design: Computed from running totals in O(1) rather than scanning the
+        performance records, so it also covers records evicted from the deque.
+
         Args:
             operation_type (str, optional): Filter by operation type
 
         Returns:
             float: Average execution time in seconds, or None if no data
         """
-        if not self.metrics["performance"]:
-            return None
-
-        times = [
-            p["time"]
-            for p in self.metrics["performance"]
-            if operation_type is None or p["operation"] == operation_type
-        ]
+        if operation_type is None:
+            time_sum, time_count = self._time_sum, self._time_count
+        else:
+            tool_metrics = self.metrics["tool_usage"].get(operation_type)
+            if tool_metrics is None:
+                return None
+            time_sum, time_count = tool_metrics["time_sum"], tool_metrics["time_count"]
 
-        if not times:
+        if not time_count:
             return None
 
-        return sum(times) / len(times)
+        return time_sum / time_count
 
     def get_evaluation_summary(self) -> Dict[str, any]:
         """
@@ -234,10 +368,8 @@ class AgentEvaluator:
             dict: Summary of all evaluation metrics
         """
         avg_content_quality = 0.0
-        if self.metrics["content_quality"]:
-            avg_content_quality = sum(
-                q["score"] for q in self.metrics["content_quality"]
-            ) / len(self.metrics["content_quality"])
+        if self._quality_count:
+            avg_content_quality = self._quality_sum / self._quality_count
 
         return {
             "overall_success_rate": round(self.get_success_rate(), 2),
@@ -256,22 +388,28 @@ class AgentEvaluator:
         }
 
 
-# Global evaluator instance
-# Design: Singleton pattern ensures consistent evaluation across all agents
-evaluator: Optional[AgentEvaluator] = None
+# Evaluator instances, one per memory bank
+# Design: Singleton per memory bank ensures consistent evaluation across all
+# agents; the cache is keyed by the bank itself (hashed by identity), and the
+# lock makes first-time creation thread-safe
+_evaluator_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=None)
+def _evaluator_for(memory_bank: PersistentMemoryBank) -> AgentEvaluator:
+    """Create the evaluator for a memory bank (cached by get_evaluator)."""
+    return AgentEvaluator(memory_bank)
 
 
 def get_evaluator(memory_bank: PersistentMemoryBank) -> AgentEvaluator:
     """
-    Get or create the global evaluator instance.
+    Get or create the evaluator instance for a memory bank.
 
     Args:
         memory_bank (PersistentMemoryBank): Memory bank instance
 
     Returns:
-        AgentEvaluator: Global evaluator instance
+        AgentEvaluator: Shared evaluator instance for memory_bank
     """
-    global evaluator
-    if evaluator is None:
-        evaluator = AgentEvaluator(memory_bank)
-    return evaluator
+    with _evaluator_lock:
+        return _evaluator_for(memory_bank)
@@ -8,6 +8,8 @@ Design Decisions:
 - State persistence allows operations to survive process restarts
 - Checkpoint-based pause/resume for granular control
 - JSON-based state storage for human readability
+- Changes are appended to a JSONL journal and folded into the JSON snapshot
+  in batches, so a checkpoint doesn't rewrite every operation
 - Operation status tracking for monitoring
 
 Behavior:
@@ -17,14 +19,18 @@ Behavior:
 - Supports cancellation and cleanup
 """
 
-import json
+import atexit
 import os
+import queue
+import threading
 import time
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
 
 from .utils.logging import log_event
+from .utils.serialization import json_dumps, json_loads
 
 
 class OperationStatus(Enum):
@@ -38,6 +44,10 @@ class OperationStatus(Enum):
     CANCELLED = "cancelled"
 
 
+# Status lookup by stored value; a dict hit is cheaper than OperationStatus(value)
+_STATUS_BY_VALUE = {status.value: status for status in OperationStatus}
+
+
 class LongRunningOperation:
     """
     Manages a long-running operation with pause/resume capabilities.
@@ -52,8 +62,30 @@ class LongRunningOperation:
         state (dict): Current operation state
         created_at (datetime): When the operation was created
         updated_at (datetime): When the operation was last updated
+        updated_at_ns (int): updated_at in nanoseconds since the epoch
     """
 
+    # Design: __slots__ avoids a per-instance __dict__, which matters when
+    # many operations are kept in memory by the manager
+    __slots__ = (
+        "operation_id",
+        "operation_type",
+        "status",
+        "checkpoints",
+        "state",
+        "_state_shared",
+        "created_at",
+        "updated_at_ns",
+        "error_message",
+        "_version",
+        "_dict_cache",
+        "_dict_cache_version",
+        "_journaled",
+        "_journaled_checkpoints",
+        "_changed_keys",
+        "_state_replaced",
+    )
+
     def __init__(
         self,
         operation_id: str,
@@ -73,14 +105,45 @@ class LongRunningOperation:
         self.status = OperationStatus.PENDING
         self.checkpoints = []
         self.state = initial_state or {}
+        # Design: Copy-on-write. While True, self.state is shared with the last
+        # checkpoint and is cloned once before the next mutation, so pause and
+        # resume are O(1) and unchanged state isn't duplicated per checkpoint
+        self._state_shared = False
         self.created_at = datetime.now()
-        self.updated_at = datetime.now()
+        # Design: Stored as integer ns so frequent state updates don't build a
+        # datetime; converted only when read or serialized
+        self.updated_at_ns = time.time_ns()
         self.error_message: Optional[str] = None
+        # Bumped by every mutator; to_dict() is cached per version
+        self._version = 0
+        self._dict_cache: Optional[Dict] = None
+        self._dict_cache_version = -1
+        # Journal bookkeeping (see _journal_record): whether a full record was
+        # written, how many checkpoints it has seen, and state changed since
+        self._journaled = False
+        self._journaled_checkpoints = 0
+        self._changed_keys: set = set()
+        self._state_replaced = False
+
+    @property
+    def updated_at(self) -> datetime:
+        """When the operation was last updated, as a local datetime."""
+        return datetime.fromtimestamp(self.updated_at_ns / 1e9)
+
+    @updated_at.setter
+    def updated_at(self, value: datetime):
+        self.updated_at_ns = _datetime_to_ns(value)
+        self._version += 1
+
+    def _touch(self):
+        """Record a mutation: refresh updated_at and invalidate to_dict()."""
+        self.updated_at_ns = time.time_ns()
+        self._version += 1
 
     def start(self):
         """Mark the operation as running."""
         self.status = OperationStatus.RUNNING
-        self.updated_at = datetime.now()
+        self._touch()
         log_event(f"Long-running operation {self.operation_id} started")
 
     def pause(self, checkpoint_data: Optional[Dict] = None):
@@ -99,12 +162,13 @@ class LongRunningOperation:
         checkpoint = {
             "checkpoint_id": len(self.checkpoints),
             "timestamp": datetime.now().isoformat(),
-            "state": self.state.copy(),
+            "state": self.state,  # Shared until the next mutation
             "data": checkpoint_data or {},
         }
+        self._state_shared = True
         self.checkpoints.append(checkpoint)
         self.status = OperationStatus.PAUSED
-        self.updated_at = datetime.now()
+        self._touch()
         log_event(
             f"Long-running operation {self.operation_id} paused at checkpoint {len(self.checkpoints)}"
         )
@@ -117,7 +181,8 @@ class LongRunningOperation:
         The operation continues from where it was paused.
 
         Returns:
-            dict: The state from the last checkpoint
+            Mapping: Read-only view of the state from the last checkpoint
+                (shared with the checkpoint; use update_state to modify it)
         """
         if self.status != OperationStatus.PAUSED:
             raise ValueError(f"Cannot resume operation in status: {self.status}")
@@ -126,13 +191,15 @@ class LongRunningOperation:
             raise ValueError("No checkpoints available to resume from")
 
         last_checkpoint = self.checkpoints[-1]
-        self.state = last_checkpoint["state"].copy()
+        self.state = last_checkpoint["state"]
+        self._state_shared = True
+        self._state_replaced = True
         self.status = OperationStatus.RUNNING
-        self.updated_at = datetime.now()
+        self._touch()
         log_event(
             f"Long-running operation {self.operation_id} resumed from checkpoint {len(self.checkpoints)}"
         )
-        return self.state
+        return MappingProxyType(self.state)
 
     def complete(self, result: Optional[Dict] = None):
         """
@@ -142,9 +209,11 @@ class LongRunningOperation:
             result (dict, optional): Final result of the operation
         """
         self.status = OperationStatus.COMPLETED
-        self.updated_at = datetime.now()
+        self._touch()
         if result:
+            self._own_state()
             self.state["result"] = result
+            self._changed_keys.add("result")
         log_event(f"Long-running operation {self.operation_id} completed")
 
     def fail(self, error_message: str):
@@ -156,13 +225,13 @@ class LongRunningOperation:
         """
         self.status = OperationStatus.FAILED
         self.error_message = error_message
-        self.updated_at = datetime.now()
+        self._touch()
         log_event(f"Long-running operation {self.operation_id} failed: {error_message}")
 
     def cancel(self):
         """Cancel the operation."""
         self.status = OperationStatus.CANCELLED
-        self.updated_at = datetime.now()
+        self._touch()
         log_event(f"Long-running operation {self.operation_id} cancelled")
 
     def update_state(self, key: str, value: Any):
@@ -173,26 +242,116 @@ class LongRunningOperation:
             key (str): State key to update
             value (Any): Value to store
         """
+        self._own_state()
         self.state[key] = value
-        self.updated_at = datetime.now()
+        self._changed_keys.add(key)
+        self._touch()
+
+    def _own_state(self):
+        """Clone the state if it is still shared with a checkpoint."""
+        if self._state_shared:
+            self.state = dict(self.state)
+            self._state_shared = False
 
     def get_state(self, key: Optional[str] = None) -> Any:
         """
         Get operation state.
 
+        Design: The entire state is returned as a read-only view: it may be
+        shared with a checkpoint (copy-on-write), so writing to it directly
+        would rewrite checkpoint history. Use update_state to modify it.
+
         Args:
             key (str, optional): Specific state key, or None for entire state
 
         Returns:
-            Any: State value(s)
+            Any: State value, or a read-only Mapping of the entire state
         """
         if key is None:
-            return self.state
+            return MappingProxyType(self.state)
         return self.state.get(key)
 
+    def _journal_record(self) -> Dict:
+        """
+        Build the journal line for this operation's changes since the last one.
+
+        Design: The first record is the full operation; later ones only carry
+        the status fields, checkpoints added since and changed state keys, so
+        repeated pause/resume cycles don't rewrite every earlier checkpoint
+        (and its state) into the journal. A state still shared with the last
+        checkpoint is recorded as a reference to it.
+
+        Returns:
+            dict: Full (has "operation_type") or delta journal record
+        """
+        if not self._journaled:
+            record = self.to_dict()
+        else:
+            record = {
+                "operation_id": self.operation_id,
+                "status": self.status.value,
+                "updated_at": self.updated_at.isoformat(),
+                "error_message": self.error_message,
+            }
+            journaled = self._journaled_checkpoints
+            if len(self.checkpoints) != journaled:
+                record["checkpoints_from"] = journaled
+                record["new_checkpoints"] = self.checkpoints[journaled:]
+            if self._state_replaced or self._changed_keys:
+                checkpoints = self.checkpoints
+                if checkpoints and self.state is checkpoints[-1]["state"]:
+                    record["state_from_checkpoint"] = True
+                elif self._state_replaced:
+                    record["state"] = self.state
+                else:
+                    state = self.state
+                    record["state_changes"] = {
+                        key: state[key] for key in self._changed_keys
+                    }
+        self._journaled = True
+        self._journaled_checkpoints = len(self.checkpoints)
+        self._changed_keys = set()
+        self._state_replaced = False
+        return record
+
+    def _apply_journal_record(self, data: Dict):
+        """
+        Apply a delta record written by _journal_record.
+
+        Behavior: Idempotent, so replaying a segment already covered by the
+        snapshot leaves the operation unchanged.
+
+        Args:
+            data (dict): Delta journal record for this operation
+        """
+        self.status = _STATUS_BY_VALUE[data["status"]]
+        self.updated_at_ns = _datetime_to_ns(datetime.fromisoformat(data["updated_at"]))
+        self.error_message = data.get("error_message")
+        if "new_checkpoints" in data:
+            del self.checkpoints[data["checkpoints_from"] :]
+            self.checkpoints.extend(data["new_checkpoints"])
+        if data.get("state_from_checkpoint"):
+            self.state = self.checkpoints[-1]["state"]
+            self._state_shared = True
+        elif "state" in data:
+            self.state = data["state"]
+            self._state_shared = False
+        elif "state_changes" in data:
+            self._own_state()
+            self.state.update(data["state_changes"])
+        self._journaled_checkpoints = len(self.checkpoints)
+        self._version += 1
+
     def to_dict(self) -> Dict:
-        """Convert operation to dictionary for serialization."""
-        return {
+        """
+        Convert operation to dictionary for serialization.
+
+        Design: Cached until the next mutation, so snapshots don't rebuild
+        the dicts of unchanged operations. Treat the result as read-only.
+        """
+        if self._dict_cache_version == self._version:
+            return self._dict_cache
+        self._dict_cache = {
             "operation_id": self.operation_id,
             "operation_type": self.operation_type,
             "status": self.status.value,
@@ -202,65 +361,362 @@ class LongRunningOperation:
             "updated_at": self.updated_at.isoformat(),
             "error_message": self.error_message,
         }
+        self._dict_cache_version = self._version
+        return self._dict_cache
 
     @classmethod
     def from_dict(cls, data: Dict) -> "LongRunningOperation":
-        """Create operation from dictionary."""
-        op = cls(data["operation_id"], data["operation_type"], data.get("state", {}))
-        op.status = OperationStatus(data["status"])
-        op.checkpoints = data.get("checkpoints", [])
+        """
+        Create operation from dictionary.
+
+        Design: Fills the slots directly instead of calling __init__, which
+        would read the clock and build defaults that are overwritten right
+        away; this is the hot path when loading the snapshot and journal.
+        Keep in sync with __init__.
+        """
+        op = cls.__new__(cls)
+        op.operation_id = data["operation_id"]
+        op.operation_type = data["operation_type"]
+        op.status = _STATUS_BY_VALUE[data["status"]]
+        op.checkpoints = checkpoints = data.get("checkpoints", [])
+        op.state = data.get("state") or {}
+        op._state_shared = False
+        # Restore the copy-on-write sharing lost in serialization: identical
+        # consecutive checkpoint states (and a current state equal to the
+        # last one) are stored once instead of once per checkpoint
+        previous = None
+        for checkpoint in checkpoints:
+            state = checkpoint.get("state")
+            if previous is not None and state == previous:
+                checkpoint["state"] = previous
+            else:
+                previous = state
+        if previous is not None and op.state == previous:
+            op.state = previous
+            op._state_shared = True
         op.created_at = datetime.fromisoformat(data["created_at"])
-        op.updated_at = datetime.fromisoformat(data["updated_at"])
+        op.updated_at_ns = _datetime_to_ns(datetime.fromisoformat(data["updated_at"]))
         op.error_message = data.get("error_message")
+        op._version = 0
+        op._dict_cache = None
+        op._dict_cache_version = -1
+        # Already on disk (snapshot or journal), so later records are deltas
+        op._journaled = True
+        op._journaled_checkpoints = len(checkpoints)
+        op._changed_keys = set()
+        op._state_replaced = False
         return op
 
 
+def _datetime_to_ns(value: datetime) -> int:
+    """Convert a datetime to integer nanoseconds since the epoch."""
+    return round(value.timestamp() * 1_000_000) * 1000
+
+
 class LongRunningOperationManager:
     """
     Manages multiple long-running operations.
 
     This class provides a centralized way to manage, persist, and resume
     long-running operations across the application.
+
+    Design: Persistence is split into a full JSON snapshot (storage_file) and
+    an append-only JSONL journal next to it. Each change appends one line for
+    the changed operation (in full the first time, afterwards only what
+    changed; see LongRunningOperation._journal_record), so the journal grows
+    with the changes rather than the size of the operations. The snapshot is
+    only rewritten (and the journal
+    truncated) once batch_size operations are dirty, on flush(), or at exit
+    (for the module-level operation_manager).
+    Completion and failure flush immediately since they are final.
+
+    Snapshots are built and written in two phases: the operations are
+    serialized under the lock (a consistent view), and the snapshot file
+    write happens after the lock is released, so mutators never wait for a
+    snapshot write. They do still do small file I/O under the lock: each
+    change appends its journal line there, and building a snapshot moves the
+    journal aside, so journal order always matches snapshot order. The
+    journal covered by a snapshot is set aside as a ".pending" segment while
+    the snapshot is written, and deleted only once it is on disk.
+    Batch-triggered snapshots are handed to a background writer thread that
+    only writes the most recent queued snapshot; flush() and final states
+    write synchronously.
     """
 
-    def __init__(self, storage_file: str = "long_running_operations.json"):
+    def __init__(
+        self,
+        storage_file: str = "long_running_operations.json",
+        batch_size: int = 32,
+    ):
         """
         Initialize the operation manager.
 
         Args:
             storage_file (str): File path for persisting operations
+            batch_size (int): Number of dirty operations that triggers a
+                snapshot rewrite
         """
         self.storage_file = storage_file
-        self.operations: Dict[str, LongRunningOperation] = {}
-        self._load_operations()
+        self.journal_file = os.path.splitext(storage_file)[0] + ".log"
+        # Journal lines already covered by a snapshot that isn't on disk yet
+        self._pending_journal_file = self.journal_file + ".pending"
+        # Loaded from disk on first access (see the operations property)
+        self._operations: Optional[Dict[str, LongRunningOperation]] = None
+        # IDs of operations changed since the last snapshot
+        self._dirty_ids: set = set()
+        self._batch_size = batch_size
+        # Guards operations/journal state; held for journal appends and
+        # rotation and for serializing snapshots, but not snapshot writes
+        self._lock = threading.RLock()
+        # Serializes snapshot file writes; versions let a newer snapshot win
+        self._write_lock = threading.Lock()
+        self._snapshot_version = 0
+        self._written_version = 0
+        # Snapshots for the background writer, started on first use
+        self._write_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._writer: Optional[threading.Thread] = None
+
+    @property
+    def operations(self) -> Dict[str, LongRunningOperation]:
+        """
+        Operations by ID, loaded from storage on first access.
+
+        Design: The module-level manager is created at import time, so
+        loading lazily keeps imports that never touch operations from
+        parsing the snapshot and journal.
+        """
+        if self._operations is None:
+            with self._lock:
+                if self._operations is None:
+                    self._operations = self._load_operations()
+        return self._operations
+
+    def _load_operations(self) -> Dict[str, LongRunningOperation]:
+        """
+        Load operations from storage file.
+
+        Returns:
+            dict: Operations by ID (snapshot plus replayed journal)
+        """
+        operations: Dict[str, LongRunningOperation] = {}
+        # Design: Open directly (no os.path.isfile stat first); a missing
+        # file is the FileNotFoundError case
+        try:
+            with open(self.storage_file, "r", encoding="utf-8") as f:
+                data = json_loads(f.read())
+                for op_data in data.get("operations", []):
+                    op = LongRunningOperation.from_dict(op_data)
+                    operations[op.operation_id] = op
+            log_event(
+                f"Loaded {len(operations)} long-running operations from storage"
+            )
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            log_event(f"Error loading long-running operations: {str(e)}")
+            operations = {}
+        self._replay_journal(self._pending_journal_file, operations)
+        self._replay_journal(self.journal_file, operations)
+        return operations
+
+    def _replay_journal(
+        self, journal_file: str, operations: Dict[str, LongRunningOperation]
+    ):
+        """
+        Apply journaled changes newer than the snapshot.
+
+        Behavior: Full records replace the operation, delta records are
+        applied on top of it; later lines win. Unreadable lines (e.g. a write
+        torn by a crash) are skipped. Replayed operations stay dirty so the
+        next snapshot includes them.
 
-    def _load_operations(self):
-        """Load operations from storage file."""
-        if os.path.isfile(self.storage_file):
+        Args:
+            journal_file (str): Journal segment to replay
+            operations (dict): Operations to update in place
+        """
+        try:
+            with open(journal_file, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        data = json_loads(line)
+                        if "operation_type" in data:  # Full record
+                            op = LongRunningOperation.from_dict(data)
+                            operations[op.operation_id] = op
+                        else:
+                            op = operations.get(data["operation_id"])
+                            if op is None:  # Its full record was lost
+                                continue
+                            op._apply_journal_record(data)
+                    except (ValueError, KeyError, TypeError, IndexError):
+                        continue
+                    self._dirty_ids.add(op.operation_id)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            log_event(f"Error replaying long-running operations journal: {str(e)}")
+
+    def _mark_dirty(self, op: LongRunningOperation):
+        """
+        Persist a change to one operation by appending it to the journal.
+
+        Args:
+            op (LongRunningOperation): The changed operation
+        """
+        with self._lock:
             try:
-                with open(self.storage_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    for op_data in data.get("operations", []):
-                        op = LongRunningOperation.from_dict(op_data)
-                        self.operations[op.operation_id] = op
-                log_event(
-                    f"Loaded {len(self.operations)} long-running operations from storage"
-                )
+                line = json_dumps(op._journal_record()) + "\n"
+                with open(self.journal_file, "a", encoding="utf-8") as f:
+                    f.write(line)
             except Exception as e:
-                log_event(f"Error loading long-running operations: {str(e)}")
-                self.operations = {}
+                # Later deltas would build on the lost one; write in full next
+                op._journaled = False
+                log_event(f"Error journaling long-running operation: {str(e)}")
+            self._dirty_ids.add(op.operation_id)
+            batch_full = len(self._dirty_ids) >= self._batch_size
+        if batch_full:
+            snapshot = self._prepare_snapshot()
+            if snapshot is not None:
+                self._enqueue_snapshot(snapshot)
+
+    def flush(self):
+        """
+        Fold journaled changes into the snapshot file and reset the journal.
 
-    def _save_operations(self):
-        """Save operations to storage file."""
-        try:
-            data = {
+        Behavior: Writes synchronously. Any snapshot still queued for the
+        background writer is superseded by this one.
+        """
+        snapshot = self._prepare_snapshot()
+        if snapshot is not None:
+            self._commit_snapshot(*snapshot)
+
+    def _prepare_snapshot(self) -> Optional[tuple]:
+        """
+        Build a snapshot of the current operations under the lock.
+
+        Returns:
+            tuple: (data, version, dirty_ids), or None if the snapshot on
+                disk (or queued) is already current
+        """
+        with self._lock:
+            if not self._dirty_ids and self._snapshot_version == self._written_version:
+                return None
+            data = self._build_snapshot()
+            dirty_ids = self._dirty_ids
+            self._dirty_ids = set()
+            self._snapshot_version += 1
+            version = self._snapshot_version
+            self._rotate_journal()
+        return data, version, dirty_ids
+
+    def _commit_snapshot(self, data: str, version: int, dirty_ids: set):
+        """Write a prepared snapshot; on failure its operations become dirty again."""
+        if not self._write_snapshot(data, version):
+            with self._lock:
+                self._dirty_ids |= dirty_ids  # Retry on the next flush
+
+    def _enqueue_snapshot(self, snapshot: tuple):
+        """Hand a prepared snapshot to the background writer thread."""
+        with self._lock:
+            if self._writer is None:
+                self._writer = threading.Thread(
+                    target=self._writer_loop,
+                    name="long-running-operations-writer",
+                    daemon=True,
+                )
+                self._writer.start()
+        self._write_queue.put_nowait(snapshot)
+
+    def _writer_loop(self):
+        """
+        Write queued snapshots, coalescing a backlog into its newest entry.
+
+        Design: Each snapshot contains every operation, so when several are
+        queued only the last needs writing; their dirty sets are merged so
+        a failed write still retries all of them.
+        """
+        while True:
+            data, version, dirty_ids = self._write_queue.get()
+            while True:
+                try:
+                    data, version, newer_dirty_ids = self._write_queue.get_nowait()
+                except queue.Empty:
+                    break
+                dirty_ids |= newer_dirty_ids
+            self._commit_snapshot(data, version, dirty_ids)
+
+    def _build_snapshot(self) -> str:
+        """
+        Serialize all operations (caller holds the lock).
+
+        Returns:
+            str: Snapshot JSON document
+        """
+        return json_dumps(
+            {
                 "operations": [op.to_dict() for op in self.operations.values()],
                 "updated_at": datetime.now().isoformat(),
             }
-            with open(self.storage_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
+        )
+
+    def _rotate_journal(self):
+        """
+        Move the current journal into the pending segment (caller holds the lock).
+
+        Behavior: If an earlier snapshot is still unwritten, the journal is
+        appended to its pending segment, since the new snapshot covers both.
+        """
+        try:
+            if os.path.exists(self._pending_journal_file):
+                with open(self.journal_file, "r", encoding="utf-8") as src:
+                    lines = src.read()
+                with open(self._pending_journal_file, "a", encoding="utf-8") as dst:
+                    dst.write(lines)
+                os.remove(self.journal_file)
+            else:
+                os.replace(self.journal_file, self._pending_journal_file)
+        except FileNotFoundError:
+            pass  # Nothing journaled since the last snapshot
         except Exception as e:
-            log_event(f"Error saving long-running operations: {str(e)}")
+            log_event(f"Error rotating long-running operations journal: {str(e)}")
+
+    def _write_snapshot(self, data: str, version: int) -> bool:
+        """
+        Write a snapshot to storage file.
+
+        Design: Writes a temp file, fsyncs and atomically replaces the
+        snapshot, so a crash leaves either the old or the new snapshot. A
+        snapshot superseded by a newer written one is skipped.
+
+        Args:
+            data (str): Snapshot JSON document
+            version (int): Snapshot version from flush()
+
+        Returns:
+            bool: True if the snapshot is on disk (or superseded)
+        """
+        with self._write_lock:
+            if version <= self._written_version:
+                return True
+            tmp_file = self.storage_file + ".tmp"
+            try:
+                with open(tmp_file, "w", encoding="utf-8") as f:
+                    f.write(data)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_file, self.storage_file)
+            except Exception as e:
+                log_event(f"Error saving long-running operations: {str(e)}")
+                return False
+            self._written_version = version
+            with self._lock:
+                # Only drop the pending journal if no newer snapshot covers
+                # lines rotated into it after this one was built
+                if version == self._snapshot_version:
+                    try:
+                        os.remove(self._pending_journal_file)
+                    except FileNotFoundError:
+                        pass
+            return True
 
     def create_operation(
         self,
@@ -281,7 +737,7 @@ class LongRunningOperationManager:
         """
         op = LongRunningOperation(operation_id, operation_type, initial_state)
         self.operations[operation_id] = op
-        self._save_operations()
+        self._mark_dirty(op)
         return op
 
     def get_operation(self, operation_id: str) -> Optional[LongRunningOperation]:
@@ -296,6 +752,18 @@ class LongRunningOperationManager:
         """
         return self.operations.get(operation_id)
 
+    def start_operation(self, operation_id: str):
+        """
+        Mark an operation as running.
+
+        Args:
+            operation_id (str): Operation identifier
+        """
+        op = self.get_operation(operation_id)
+        if op:
+            op.start()
+            self._mark_dirty(op)
+
     def pause_operation(
         self, operation_id: str, checkpoint_data: Optional[Dict] = None
     ):
@@ -309,9 +777,9 @@ class LongRunningOperationManager:
         op = self.get_operation(operation_id)
         if op:
             op.pause(checkpoint_data)
-            self._save_operations()
+            self._mark_dirty(op)
 
-    def resume_operation(self, operation_id: str) -> Optional[Dict]:
+    def resume_operation(self, operation_id: str) -> Optional[Mapping]:
         """
         Resume a paused operation.
 
@@ -319,15 +787,44 @@ class LongRunningOperationManager:
             operation_id (str): Operation identifier
 
         Returns:
-            dict: The restored state, or None if operation not found
+            Mapping: Read-only view of the restored state, or None if
+                operation not found
         """
         op = self.get_operation(operation_id)
         if op:
             state = op.resume()
-            self._save_operations()
+            self._mark_dirty(op)
             return state
         return None
 
+    def complete_operation(self, operation_id: str, result: Optional[Dict] = None):
+        """
+        Complete an operation and persist it immediately.
+
+        Args:
+            operation_id (str): Operation identifier
+            result (dict, optional): Final result of the operation
+        """
+        op = self.get_operation(operation_id)
+        if op:
+            op.complete(result)
+            self._mark_dirty(op)
+            self.flush()
+
+    def fail_operation(self, operation_id: str, error_message: str):
+        """
+        Mark an operation as failed and persist it immediately.
+
+        Args:
+            operation_id (str): Operation identifier
+            error_message (str): Error message describing the failure
+        """
+        op = self.get_operation(operation_id)
+        if op:
+            op.fail(error_message)
+            self._mark_dirty(op)
+            self.flush()
+
     def list_operations(
         self, status: Optional[OperationStatus] = None
     ) -> list[LongRunningOperation]:
@@ -342,9 +839,14 @@ class LongRunningOperationManager:
         """
         if status is None:
             return list(self.operations.values())
-        return [op for op in self.operations.values() if op.status == status]
+        return [op for op in self.operations.values() if op.status is status]
 
 
 # Global operation manager instance
 # Design: Singleton pattern ensures consistent operation management
 operation_manager = LongRunningOperationManager()
+# Fold the journal into the snapshot at exit
+# Design: Registered for the singleton only, so managers created elsewhere
+# (e.g. for a different storage file) aren't kept alive until exit; they
+# call flush() themselves
+atexit.register(operation_manager.flush)
@@ -5,10 +5,14 @@ This module provides long-term memory storage for the Developer Portfolio Assist
 It implements a JSON-backed memory system that persists portfolio updates across sessions.
 
 Design Decisions:
-- JSON format chosen for human readability and easy debugging
+- JSON Lines format (one entry per line) keeps entries human readable while
+  letting each save append a single line instead of rewriting the file
 - UTF-8 encoding ensures proper handling of international characters
-- Lazy loading: memory is loaded once at initialization for performance
-- Atomic writes: each save operation persists immediately to prevent data loss
+- Lazy loading: memory is loaded once, on first read, so importing the
+  module (and appending new entries) never parses the whole bank
+- Immediate writes: each save operation persists immediately to prevent data loss
+- Full rewrites (migration, repair) go through a temp file and os.replace
+- Thread-safe: saves may run on a background thread while agents query
 
 Behavior:
 - Automatically loads existing memory on initialization
@@ -20,6 +24,10 @@ Behavior:
 import datetime
 import json
 import os
+import threading
+from collections import defaultdict
+
+from .utils.serialization import json_dumps, json_loads
 
 
 class PersistentMemoryBank:
@@ -31,45 +39,103 @@ class PersistentMemoryBank:
     past activities and maintain context across sessions.
 
     Attributes:
-        filename (str): Path to the JSON file storing memory entries
+        filename (str): Path to the JSON Lines file storing memory entries
         entries (list): In-memory list of all stored entries
     """
 
-    def __init__(self, filename="memory_bank.json"):
+    def __init__(self, filename="memory_bank.jsonl"):
         """
-        Initialize the memory bank and load existing entries.
+        Initialize the memory bank.
 
-        Design: Loads memory at initialization to ensure all agents have access
-        to historical data immediately. This follows the singleton pattern used
-        in agent.py where memory_bank is shared across all agents.
+        Design: Existing entries are loaded on first access to entries, not
+        here, since the module-level singleton is created at import time and
+        many code paths never read memory. This follows the singleton pattern
+        used in agent.py where memory_bank is shared across all agents.
 
         Args:
-            filename (str): Path to the JSON file for persistence
+            filename (str): Path to the JSON Lines file for persistence
         """
         self.filename = filename
-        self.entries = self._load_entries()
+        self._entries = None  # Loaded lazily by the entries property
+        # Index of entry positions per username so history queries don't
+        # scan every entry; entries are append-only, so positions are stable
+        self._by_user = None
+        # Per-user history lists returned by get_history, so repeated polling
+        # for the same user is a dict lookup; save() invalidates the user's list
+        self._history_cache = {}
+        # Guards loading, saves and history lookups, so saves can run on a
+        # background thread (reentrant: save() may trigger the lazy load)
+        self._lock = threading.RLock()
+
+    @property
+    def entries(self):
+        """All stored entries, loaded from disk on first access."""
+        if self._entries is None:
+            with self._lock:
+                if self._entries is None:  # Not loaded by another thread meanwhile
+                    entries = self._load_entries()
+                    by_user = defaultdict(list)
+                    for index, entry in enumerate(entries):
+                        by_user[entry.get("username")].append(index)
+                    self._by_user = by_user
+                    self._entries = entries
+        return self._entries
 
     def _load_entries(self):
         """
-        Load entries from the JSON file.
+        Load entries from the JSON Lines file.
 
-        Behavior: Attempts to read and parse the JSON file. If the file doesn't
-        exist or is corrupted, returns an empty list. This graceful degradation
-        ensures the agent can start even if memory file is missing.
+        Behavior: Parses one entry per line. Unreadable lines (e.g. a write
+        torn by a crash) are skipped and the file is rewritten without them,
+        so one bad line no longer discards the whole bank. If the file doesn't
+        exist, a legacy JSON array bank (same name with a .json extension) is
+        migrated. This graceful degradation ensures the agent can start even
+        if memory file is missing.
 
         Returns:
             list: List of memory entries, or empty list if file doesn't exist
         """
-        if os.path.isfile(self.filename):
-            try:
-                with open(self.filename, "r", encoding="utf-8") as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError):
-                # Graceful degradation: if file is corrupted, start fresh
-                # This prevents the agent from crashing due to bad memory data
-                return []
-        else:
+        # Design: Open directly instead of checking os.path.isfile first;
+        # a missing file costs one failed open rather than a stat plus open
+        entries = []
+        skipped = 0
+        try:
+            with open(self.filename, "r", encoding="utf-8") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        entries.append(json_loads(line))
+                    except json.JSONDecodeError:
+                        skipped += 1
+        except FileNotFoundError:
+            return self._migrate_legacy_file()
+        except IOError:
+            # Graceful degradation: if file is unreadable, start fresh
+            # This prevents the agent from crashing due to bad memory data
+            return []
+
+        if skipped:
+            self._compact(entries)
+        return entries
+
+    def _migrate_legacy_file(self):
+        """
+        Convert a legacy JSON array bank into the JSON Lines file.
+
+        Returns:
+            list: Migrated entries, or empty list if there is no legacy file
+        """
+        legacy_filename = os.path.splitext(self.filename)[0] + ".json"
+        if legacy_filename == self.filename:
+            return []
+        try:
+            with open(legacy_filename, "r", encoding="utf-8") as f:
+                entries = json_loads(f.read())
+        except (json.JSONDecodeError, IOError):  # Includes a missing file
             return []
+        self._compact(entries)
+        return entries
 
     def save(self, username, post, meta=None):
         """
@@ -95,28 +161,55 @@ class PersistentMemoryBank:
             "meta": meta or {},
             "timestamp": datetime.datetime.now().isoformat(),
         }
-        self.entries.append(entry)
-        self._persist()  # Immediate persistence for data safety
+        with self._lock:
+            if self._entries is None and not os.path.exists(self.filename):
+                self.entries  # Load first so a legacy bank is migrated, not shadowed
+            # Not loaded yet: the appended line is picked up by the later load
+            if self._entries is not None:
+                self._by_user[username].append(len(self._entries))
+                self._entries.append(entry)
+                self._history_cache.pop(username, None)
+            self._persist(entry)  # Immediate persistence for data safety
         return entry
 
-    def _persist(self):
+    def _persist(self, entry):
         """
-        Write all entries to the JSON file.
+        Append one entry to the JSON Lines file.
 
-        Behavior: Writes the entire entries list to disk. This approach ensures
-        consistency - either all entries are saved or none (atomic operation).
-        Uses pretty-printing (indent=2) for human readability during debugging.
+        Behavior: Writes a single line in one write call, so the cost is
+        independent of how many entries the bank already holds.
 
         Error Handling: Catches and logs errors without raising exceptions.
         This prevents memory save failures from crashing the agent workflow.
+
+        Args:
+            entry (dict): Entry to append
         """
         try:
-            with open(self.filename, "w", encoding="utf-8") as f:
-                json.dump(self.entries, f, indent=2)
+            with open(self.filename, "a", encoding="utf-8") as f:
+                f.write(json_dumps(entry) + "\n")
         except Exception as e:
             # Log error but don't crash - memory persistence is important but not critical
             print(f"Error saving memory: {str(e)}")
 
+    def _compact(self, entries):
+        """
+        Rewrite the JSON Lines file with exactly the given entries.
+
+        Behavior: Writes to a temporary file and atomically replaces the bank,
+        so a crash mid-write leaves the previous file intact.
+
+        Args:
+            entries (list): Entries to write
+        """
+        tmp_filename = self.filename + ".tmp"
+        try:
+            with open(tmp_filename, "w", encoding="utf-8") as f:
+                f.writelines(json_dumps(entry) + "\n" for entry in entries)
+            os.replace(tmp_filename, self.filename)
+        except Exception as e:
+            print(f"Error compacting memory: {str(e)}")
+
     def get_history(self, username=None):
         """
         Retrieve memory entries, optionally filtered by username.
@@ -127,6 +220,8 @@ class PersistentMemoryBank:
         Behavior:
         - If username is provided, returns only entries for that user
         - If username is None, returns all entries (for admin/debugging purposes)
+        - Per-user lists are cached until that user's next save, so callers
+          must treat the returned list as read-only
 
         Args:
             username (str, optional): Filter entries by this username
@@ -135,8 +230,14 @@ class PersistentMemoryBank:
             list: List of memory entries matching the filter criteria
         """
         if username:
-            # Filter entries by username for user-specific queries
-            return [e for e in self.entries if e["username"] == username]
+            history = self._history_cache.get(username)
+            if history is None:
+                with self._lock:
+                    # Look up the user's entries via the per-user index
+                    entries = self.entries
+                    history = [entries[i] for i in self._by_user.get(username, ())]
+                    self._history_cache[username] = history
+            return history
         # Return all entries if no username filter specified
         return self.entries
 
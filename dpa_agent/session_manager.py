@@ -17,9 +17,43 @@ Behavior:
 - Supports session cleanup and expiration
 """
 
+import heapq
+import time
 import uuid
+from collections import deque
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Any, Dict, Optional
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+# Default maximum number of history entries kept per session
+SESSION_HISTORY_SIZE = 1000
+
+
+@dataclass(slots=True)
+class Session:
+    """
+    State for a single user session.
+
+    Design: Slotted dataclass instead of a per-session dict keeps large
+    numbers of sessions compact in memory.
+
+    Attributes:
+        session_id (str): Unique session identifier
+        user_id (str, optional): User identifier for this session
+        created_at (datetime): Wall-clock creation time, for display only
+        last_accessed_ns (int): Last access as a time.monotonic_ns() value
+        state (dict): Workflow state storage
+        history (deque): Conversation history (bounded, oldest entries drop off)
+    """
+
+    session_id: str
+    user_id: Optional[str]
+    created_at: datetime
+    last_accessed_ns: int
+    state: Dict[str, Any] = field(default_factory=dict)
+    history: Deque[Dict[str, Any]] = field(
+        default_factory=lambda: deque(maxlen=SESSION_HISTORY_SIZE)
+    )
 
 
 class InMemorySessionService:
@@ -31,19 +65,27 @@ class InMemorySessionService:
     conversation context and workflow progress.
     
     Attributes:
-        sessions (dict): Dictionary mapping session IDs to session data
+        sessions (dict): Dictionary mapping session IDs to Session objects
         default_ttl (timedelta): Default time-to-live for sessions (24 hours)
     """
     
-    def __init__(self, default_ttl_hours: int = 24):
+    def __init__(
+        self, default_ttl_hours: int = 24, max_history: int = SESSION_HISTORY_SIZE
+    ):
         """
         Initialize the session service.
         
         Args:
             default_ttl_hours (int): Default session lifetime in hours
+            max_history (int): Maximum history entries kept per session
         """
-        self.sessions: Dict[str, Dict[str, Any]] = {}
+        self.sessions: Dict[str, Session] = {}
         self.default_ttl = timedelta(hours=default_ttl_hours)
+        self.max_history = max_history
+        # Min-heap of (expires_at_ns, session_id) so expired sessions are found
+        # without scanning every session. Times are time.monotonic_ns() values:
+        # cheaper to read than datetime.now() and immune to clock changes
+        self._expiry_heap: List[Tuple[int, str]] = []
     
     def create_session(self, user_id: Optional[str] = None) -> str:
         """
@@ -60,42 +102,47 @@ class InMemorySessionService:
         Returns:
             str: Unique session ID
         """
-        session_id = str(uuid.uuid4())
-        self.sessions[session_id] = {
-            "session_id": session_id,
-            "user_id": user_id,
-            "created_at": datetime.now(),
-            "last_accessed": datetime.now(),
-            "state": {},  # Workflow state storage
-            "history": [],  # Conversation history
-        }
+        session_id = uuid.uuid4().hex  # 32 hex chars, no hyphen formatting
+        now_ns = time.monotonic_ns()
+        self.sessions[session_id] = Session(
+            session_id,
+            user_id,
+            datetime.now(),
+            now_ns,
+            history=deque(maxlen=self.max_history),
+        )
+        ttl_ns = (self.default_ttl // timedelta(microseconds=1)) * 1000
+        heapq.heappush(self._expiry_heap, (now_ns + ttl_ns, session_id))
         return session_id
     
-    def get_session(self, session_id: str) -> Optional[Dict[str, Any]]:
+    def get_session(self, session_id: str) -> Optional[Session]:
         """
         Retrieve a session by ID.
         
         Behavior: Returns session data if it exists and hasn't expired.
-        Updates last_accessed timestamp to track activity.
+        Updates last_accessed timestamp to track activity. Other expired
+        sessions are cleaned up along the way (amortized O(log n) each).
         
         Args:
             session_id (str): Session identifier
             
         Returns:
-            dict: Session data, or None if session doesn't exist or expired
+            Session: Session data, or None if session doesn't exist or expired
         """
-        if session_id not in self.sessions:
-            return None
-        
-        session = self.sessions[session_id]
-        
-        # Check if session has expired
-        if datetime.now() - session["created_at"] > self.default_ttl:
-            self.delete_session(session_id)
+        now_ns = time.monotonic_ns()
+        # Fast path: one integer comparison against the earliest expiry; the
+        # cleanup (which also drops this session if expired) only runs when
+        # some session is actually due
+        heap = self._expiry_heap
+        if heap and heap[0][0] < now_ns:
+            self._remove_expired(now_ns)
+
+        session = self.sessions.get(session_id)
+        if session is None:
             return None
         
         # Update last accessed time
-        session["last_accessed"] = datetime.now()
+        session.last_accessed_ns = now_ns
         return session
     
     def update_session_state(self, session_id: str, key: str, value: Any) -> bool:
@@ -117,7 +164,7 @@ class InMemorySessionService:
         if not session:
             return False
         
-        session["state"][key] = value
+        session.state[key] = value
         return True
     
     def get_session_state(self, session_id: str, key: Optional[str] = None) -> Optional[Any]:
@@ -139,15 +186,40 @@ class InMemorySessionService:
             return None
         
         if key is None:
-            return session["state"]
-        return session["state"].get(key)
+            return session.state
+        return session.state.get(key)
+    
+    def get_session_states(
+        self, session_id: str, keys: List[str]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Retrieve several state values from a session with one lookup.
+        
+        Behavior: Validates the session (expiry check and last-access update)
+        once for all keys, instead of once per get_session_state call.
+        
+        Args:
+            session_id (str): Session identifier
+            keys (list): State keys to retrieve
+            
+        Returns:
+            dict: Values by key (None for missing keys), or None if the
+                session doesn't exist
+        """
+        session = self.get_session(session_id)
+        if not session:
+            return None
+        
+        state = session.state
+        return {key: state.get(key) for key in keys}
     
     def add_to_history(self, session_id: str, entry: Dict[str, Any]) -> bool:
         """
         Add an entry to the session's conversation history.
         
         Behavior: Appends a new entry to the session history. This maintains
-        a chronological record of interactions within the session.
+        a chronological record of interactions within the session. Once
+        max_history entries are stored, the oldest entry is dropped.
         
         Args:
             session_id (str): Session identifier
@@ -164,7 +236,7 @@ class InMemorySessionService:
         if "timestamp" not in entry:
             entry["timestamp"] = datetime.now().isoformat()
         
-        session["history"].append(entry)
+        session.history.append(entry)
         return True
     
     def get_history(self, session_id: str) -> Optional[list]:
@@ -175,12 +247,13 @@ class InMemorySessionService:
             session_id (str): Session identifier
             
         Returns:
-            list: Conversation history, or None if session doesn't exist
+            list: Copy of the conversation history (oldest first), or None if
+                session doesn't exist
         """
         session = self.get_session(session_id)
         if not session:
             return None
-        return session["history"]
+        return list(session.history)
     
     def delete_session(self, session_id: str) -> bool:
         """
@@ -204,22 +277,35 @@ class InMemorySessionService:
         """
         Remove all expired sessions.
         
-        Behavior: Iterates through all sessions and removes those that have
-        exceeded their TTL. Returns count of removed sessions.
+        Behavior: Pops sessions that have exceeded their TTL from the expiry
+        heap, so only expired sessions are visited. Returns count of removed
+        sessions.
         
         Returns:
             int: Number of sessions removed
         """
-        now = datetime.now()
-        expired = [
-            sid for sid, session in self.sessions.items()
-            if now - session["created_at"] > self.default_ttl
-        ]
+        return self._remove_expired(time.monotonic_ns())
+    
+    def _remove_expired(self, now_ns: int) -> int:
+        """
+        Remove sessions whose expiry time has passed.
         
-        for sid in expired:
-            self.delete_session(sid)
+        Design: Heap items for sessions deleted explicitly are skipped when
+        popped, so delete_session doesn't need to touch the heap.
         
-        return len(expired)
+        Args:
+            now_ns (int): Current time.monotonic_ns() value
+            
+        Returns:
+            int: Number of sessions removed
+        """
+        heap = self._expiry_heap
+        removed = 0
+        while heap and heap[0][0] < now_ns:
+            _, sid = heapq.heappop(heap)
+            if self.delete_session(sid):
+                removed += 1
+        return removed
 
 
 # Global session service instance
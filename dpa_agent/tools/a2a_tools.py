@@ -58,21 +58,42 @@ def send_a2a_event(to_agent: str, payload: dict, from_agent: str = "dpa_root"):
     log_event(f"A2A event sent from {from_agent} to {to_agent}")
 
 
-def get_a2a_message_history(agent_name: Optional[str] = None, limit: int = 50) -> dict:
+def get_a2a_message_history(
+    agent_name: Optional[str] = None, limit: int = 50, columnar: bool = False
+) -> dict:
     """
     Get A2A message history for an agent.
 
     This tool retrieves the message history for debugging and monitoring
     agent-to-agent communication.
 
+    Design: The columnar form returns one list per field instead of one dict
+    per message. It avoids repeating the key names for every message, which
+    keeps large histories (limit=1000+) smaller to serialize, and makes
+    column queries such as "all recipients" a single list.
+
     Args:
         agent_name (str, optional): Filter by agent name
         limit (int): Maximum number of messages to return
+        columnar (bool): Return fields as parallel lists under "columns"
 
     Returns:
-        dict: Message history with list of messages
+        dict: Message history with list of messages (or columns)
     """
     messages = a2a_protocol.get_message_history(agent_name, limit)
+    if columnar:
+        return {
+            "columns": {
+                "message_id": [msg.message_id for msg in messages],
+                "from_agent": [msg.from_agent for msg in messages],
+                "to_agent": [msg.to_agent for msg in messages],
+                "message_type": [msg.message_type.label for msg in messages],
+                "payload": [msg.payload for msg in messages],
+                "timestamp": [msg.timestamp.isoformat() for msg in messages],
+                "correlation_id": [msg.correlation_id for msg in messages],
+            },
+            "count": len(messages),
+        }
     return {
         "messages": [msg.to_dict() for msg in messages],
         "count": len(messages),
@@ -9,6 +9,7 @@ Design Decisions:
 - Implements model fallback mechanism to support both free and pro API tiers
 - Supports multiple content formats (LinkedIn, Blog, README)
 - Configurable tone and style for different use cases
+- Offline bulk generation goes through the Gemini Batch API (half price)
 
 Behavior:
 - Takes GitHub profile data and generates professional portfolio content
@@ -17,14 +18,279 @@ Behavior:
 - Logs all generation attempts for observability
 """
 
+import asyncio
+import functools
+import hashlib
 import os
-from typing import Optional
-
-import google.generativeai as genai
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional
 
 from ..context_manager import context_manager
 from ..utils.logging import log_event
 
+# Model used for Batch API jobs (see content_generator_batch)
+BATCH_MODEL = "gemini-2.5-flash"
+
+# Batch job states after which no further polling is needed
+_BATCH_DONE_STATES = {
+    "JOB_STATE_SUCCEEDED",
+    "JOB_STATE_FAILED",
+    "JOB_STATE_CANCELLED",
+    "JOB_STATE_EXPIRED",
+}
+
+# Static instructions, sent as the model's system instruction
+# Design: Kept separate from the per-developer prompt, so the instructions
+# are built once per format and tone and the prompt carries only profile data.
+# (At a few dozen tokens they are far below Gemini's context-caching minimum,
+# so they are billed with every request either way)
+SYSTEM_PROMPT_TEMPLATE = (
+    "You are an AI writing assistant helping developers auto-generate portfolio "
+    "content.\n"
+    "Format: {format_style}. Tone: {tone}."
+)
+
+# Hashtag suggestion appended to prompts when include_hashtags is set
+HASHTAGS = "#Python #OpenSource #AI "
+
+# Maximum number of generated posts kept for exact-match reuse
+RESPONSE_CACHE_SIZE = 1024
+
+# Generated content by prompt digest (see _response_key), least recently used
+# first
+# Design: An identical system prompt and prompt would be billed again for
+# an equivalent post, so successful generations are reused for exact matches
+_response_cache: "OrderedDict[str, str]" = OrderedDict()
+_response_cache_lock = threading.Lock()
+
+# Post used for profiles with nothing to write about (see _has_signal)
+_FALLBACK_TEMPLATE = (
+    "Meet {name}, a developer building in the open on GitHub.{profile} "
+    "Check out their work and follow along for what comes next!"
+)
+
+# Closing instruction lines of the prompt, built once
+_WRITE_INSTRUCTION = (
+    "\nWrite a post summarizing this developer's recent work and encourage "
+    "engagement.\n"
+)
+_HASHTAG_INSTRUCTION = f"Add relevant hashtags at the end: {HASHTAGS}\n"
+
+
+@functools.lru_cache(maxsize=64)
+def _system_prompt(format_style: str, tone: str) -> str:
+    """
+    Get the system prompt for a format and tone (cached per combination).
+
+    Args:
+        format_style (str): Content format
+        tone (str): Writing tone
+
+    Returns:
+        str: System prompt text
+    """
+    return SYSTEM_PROMPT_TEMPLATE.format(format_style=format_style, tone=tone)
+
+
+@functools.lru_cache(maxsize=None)
+def _genai():
+    """
+    Import google.generativeai on first use.
+
+    Design: The SDK pulls in grpc and protobuf, which makes importing this
+    module (e.g. just to register or list tools) noticeably slow, so the
+    import is deferred until a generation actually needs it.
+
+    Returns:
+        module: The google.generativeai module
+    """
+    import google.generativeai as genai
+
+    return genai
+
+
+@functools.lru_cache(maxsize=64)
+def _get_model(model_name: str, format_style: str, tone: str):
+    """
+    Get a Gemini model configured with the system prompt for a format and tone.
+
+    Design: Cached so repeated generations reuse the same model object
+    instead of rebuilding it per call.
+
+    Args:
+        model_name (str): Gemini model name
+        format_style (str): Content format
+        tone (str): Writing tone
+
+    Returns:
+        genai.GenerativeModel: Configured model
+    """
+    return _genai().GenerativeModel(
+        model_name, system_instruction=_system_prompt(format_style, tone)
+    )
+
+
+# API key the genai client is currently configured with
+_configured_api_key: Optional[str] = None
+
+# Models that returned "not found" for the configured API key, and the model
+# that last succeeded
+# Design: Remembered for the process (reset when the key changes) so later
+# requests don't pay a failed round trip per unavailable model
+_dead_models: set = set()
+_preferred_model: Optional[str] = None
+
+
+def _configure(api_key: str):
+    """
+    Configure the Gemini client, only when the API key changes.
+
+    Design: genai.configure rebuilds the client configuration, so it runs
+    once per key instead of on every generation. Cached models hold on to
+    the client they first used, so they are dropped when the key changes.
+
+    Args:
+        api_key (str): Gemini API key
+    """
+    global _configured_api_key, _preferred_model
+    if api_key == _configured_api_key:
+        return
+    _genai().configure(api_key=api_key)
+    _get_model.cache_clear()
+    _dead_models.clear()
+    _preferred_model = None
+    _configured_api_key = api_key
+
+
+def _build_prompt(
+    github_summary: dict, repo_activity: Optional[dict], include_hashtags: bool
+) -> str:
+    """
+    Build the per-request prompt from GitHub data.
+
+    Design: Format and tone instructions are not part of this prompt; they
+    are the model's system instruction (see _get_model).
+
+    Args:
+        github_summary (dict): Output from github_analyzer tool
+        repo_activity (dict, optional): Output from github_repo_activity tool
+        include_hashtags (bool): Whether to ask for hashtags
+
+    Returns:
+        str: Prompt text
+    """
+    # Extract relevant data from GitHub summary
+    # Design: Use fallback values to handle missing data gracefully
+    name = github_summary.get("name") or github_summary.get("login", "a developer")
+    bio = github_summary.get("bio", "")
+    repos_count = github_summary.get("public_repos", "N/A")
+    followers = github_summary.get("followers", "N/A")
+    url = github_summary.get("profile_url", "")
+
+    # Construct the prompt for Gemini
+    # Design: Structured prompt with clear sections improves generation quality.
+    # Pieces are collected in a list and joined once instead of growing a
+    # string with += per repo and commit
+    parts = [
+        f"Developer profile: Name: {name}. Bio: '{bio}'. GitHub: {url}. "
+        f"Repositories: {repos_count}. Followers: {followers}.\n"
+    ]
+
+    # Add repository activity section if repo_activity is provided
+    # Design: Optional repo activity enriches content but isn't required
+    if repo_activity and "repos" in repo_activity:
+        parts.append("Recent repository activity summary:\n")
+        for repo in repo_activity["repos"]:
+            parts.append(f"- {repo['repo_name']}: {repo['description']}\n")
+            parts.extend(
+                f"   - Latest commit: '{commit['message']}' ({commit['date']})\n"
+                for commit in repo["commits"]
+            )
+
+    parts.append(_WRITE_INSTRUCTION)
+    if include_hashtags:
+        parts.append(_HASHTAG_INSTRUCTION)
+    return "".join(parts)
+
+
+def _response_key(format_style: str, tone: str, prompt: str) -> str:
+    """
+    Digest identifying a generation request (system prompt plus prompt).
+
+    Args:
+        format_style (str): Content format
+        tone (str): Writing tone
+        prompt (str): Per-request prompt
+
+    Returns:
+        str: Hex digest
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(_system_prompt(format_style, tone).encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(prompt.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _cached_response(cache_key: str) -> Optional[str]:
+    """Return the post cached for a _response_key, or None."""
+    with _response_cache_lock:
+        content = _response_cache.get(cache_key)
+        if content is not None:
+            _response_cache.move_to_end(cache_key)
+    return content
+
+
+def _cache_response(cache_key: str, content: str):
+    """Cache a generated post, evicting the least recently used when full."""
+    with _response_cache_lock:
+        _response_cache[cache_key] = content
+        _response_cache.move_to_end(cache_key)
+        if len(_response_cache) > RESPONSE_CACHE_SIZE:
+            _response_cache.popitem(last=False)
+
+
+def _has_signal(github_summary: dict, repo_activity: Optional[dict]) -> bool:
+    """
+    Check whether a profile has anything for Gemini to write about.
+
+    Args:
+        github_summary (dict): Output from github_analyzer tool
+        repo_activity (dict, optional): Output from github_repo_activity tool
+
+    Returns:
+        bool: True if there is a bio, public repositories or repo activity
+    """
+    if github_summary.get("bio"):
+        return True
+    repos_count = github_summary.get("public_repos")
+    if isinstance(repos_count, int) and repos_count > 0:
+        return True
+    return bool(repo_activity and repo_activity.get("repos"))
+
+
+def _render_fallback(github_summary: dict, include_hashtags: bool) -> str:
+    """
+    Render the templated post for a profile without signal.
+
+    Args:
+        github_summary (dict): Output from github_analyzer tool
+        include_hashtags (bool): Whether to append hashtags
+
+    Returns:
+        str: Post text
+    """
+    name = github_summary.get("name") or github_summary.get("login", "a developer")
+    url = github_summary.get("profile_url")
+    content = _FALLBACK_TEMPLATE.format(
+        name=name, profile=f" Find them at {url}." if url else ""
+    )
+    if include_hashtags:
+        content += "\n\n" + HASHTAGS.rstrip()
+    return content
+
 
 def content_generator(
     github_summary: dict,
@@ -32,6 +298,8 @@ def content_generator(
     format_style: str = "LinkedIn",
     tone: str = "professional",
     include_hashtags: bool = True,
+    track_context: bool = True,
+    use_cache: bool = False,
 ) -> dict:
     """
     Uses Gemini to generate rich content from GitHub data and repo activity.
@@ -45,6 +313,8 @@ def content_generator(
     pro-tier API keys, improving reliability and user experience.
 
     Behavior:
+    - Returns templated content without calling Gemini if the profile has
+      no bio, public repositories or repo activity
     - Validates API key from environment variables
     - Constructs a detailed prompt from GitHub data
     - Tries multiple Gemini models until one succeeds
@@ -56,10 +326,96 @@ def content_generator(
         format_style (str): Content format - "LinkedIn", "Blog", or "README"
         tone (str): Writing tone - "professional", "energetic", "casual", etc.
         include_hashtags (bool): Whether to include hashtags in the content
+        track_context (bool): Record the prompt and response in the shared
+            context manager (disable for one-off generations)
+        use_cache (bool): Reuse the post generated earlier for an identical
+            request instead of a fresh variant (off by default, so asking
+            again produces a new post)
 
     Returns:
         dict: Dictionary with 'content' key containing generated text, or 'error' key
     """
+    return _generate_streaming(
+        github_summary,
+        repo_activity,
+        format_style,
+        tone,
+        include_hashtags,
+        track_context,
+        use_cache,
+        on_chunk=None,
+    )
+
+
+def content_generator_stream(
+    github_summary: dict,
+    on_chunk: Callable[[str], None],
+    repo_activity: Optional[dict] = None,
+    format_style: str = "LinkedIn",
+    tone: str = "professional",
+    include_hashtags: bool = True,
+    track_context: bool = True,
+    use_cache: bool = False,
+) -> dict:
+    """
+    Streaming variant of content_generator for direct (non-agent) callers.
+
+    Design: Not registered as an agent tool: a callback has no JSON-schema
+    form, so it is kept out of the tool's signature.
+
+    Args:
+        github_summary (dict): Output from github_analyzer tool
+        on_chunk (callable): Called with each piece of text as it is
+            generated, so consumers (UI, logging) can start before generation
+            finishes
+        repo_activity (dict, optional): Output from github_repo_activity tool
+        format_style (str): Content format - "LinkedIn", "Blog", or "README"
+        tone (str): Writing tone
+        include_hashtags (bool): Whether to include hashtags in the content
+        track_context (bool): Record prompt and response in the context manager
+        use_cache (bool): Reuse the post generated for an identical request
+            (passed to on_chunk in one piece)
+
+    Returns:
+        dict: Same result as content_generator
+    """
+    return _generate_streaming(
+        github_summary,
+        repo_activity,
+        format_style,
+        tone,
+        include_hashtags,
+        track_context,
+        use_cache,
+        on_chunk=on_chunk,
+    )
+
+
+def _generate_streaming(
+    github_summary: dict,
+    repo_activity: Optional[dict],
+    format_style: str,
+    tone: str,
+    include_hashtags: bool,
+    track_context: bool,
+    use_cache: bool,
+    on_chunk: Optional[Callable[[str], None]],
+) -> dict:
+    """Generate content (see content_generator), streaming it to on_chunk if given."""
+    global _preferred_model
+
+    # Design: A profile without bio, repos or activity would only produce
+    # generic filler, so skip the Gemini round trip and use a template
+    if not _has_signal(github_summary, repo_activity):
+        log_event(
+            "No profile signal for '%s'; using templated content",
+            github_summary.get("login"),
+        )
+        content = _render_fallback(github_summary, include_hashtags)
+        if on_chunk is not None:
+            on_chunk(content)
+        return {"content": content}
+
     # Retrieve API key from environment
     # Design: Environment variable approach keeps credentials secure
     api_key = os.environ.get("GOOGLE_API_KEY")
@@ -68,66 +424,56 @@ def content_generator(
         return {"error": "Gemini API key not found in environment variables."}
 
     try:
-        # Configure Gemini API client
+        # Configure Gemini API client (no-op unless the key changed)
         # Design: Single configuration point for all model instances
-        genai.configure(api_key=api_key)
+        _configure(api_key)
     except Exception as config_error:
-        log_event(f"Failed to configure Gemini API: {str(config_error)}")
+        log_event("Failed to configure Gemini API: %s", config_error)
         return {"error": f"Failed to configure Gemini API: {str(config_error)}"}
 
-    # Extract relevant data from GitHub summary
-    # Design: Use fallback values to handle missing data gracefully
+    # Names used for logging and context metadata
     name = github_summary.get("name") or github_summary.get("login", "a developer")
-    bio = github_summary.get("bio", "")
     repos_count = github_summary.get("public_repos", "N/A")
-    followers = github_summary.get("followers", "N/A")
-    url = github_summary.get("profile_url", "")
-
-    # Construct system prompt with format and tone instructions
-    # Design: Clear instructions help Gemini generate appropriate content
-    system_prompt = (
-        f"You are an AI writing assistant helping developers auto-generate portfolio content.\n"
-        f"Format: {format_style}. Tone: {tone}."
-    )
-    hashtags = "#Python #OpenSource #AI " if include_hashtags else ""
-
-    # Build repository activity section if repo_activity is provided
-    # Design: Optional repo activity enriches content but isn't required
-    repo_section = ""
-    if repo_activity and "repos" in repo_activity:
-        repo_section += "Recent repository activity summary:\n"
-        for repo in repo_activity["repos"]:
-            repo_section += f"- {repo['repo_name']}: {repo['description']}\n"
-            for commit in repo["commits"]:
-                repo_section += (
-                    f"   - Latest commit: '{commit['message']}' ({commit['date']})\n"
-                )
-
-    # Construct the full prompt for Gemini
-    # Design: Structured prompt with clear sections improves generation quality
-    prompt = (
-        f"{system_prompt}\n"
-        f"Developer profile: Name: {name}. Bio: '{bio}'. GitHub: {url}. "
-        f"Repositories: {repos_count}. Followers: {followers}.\n"
-        f"{repo_section}\n"
-        f"Write a post summarizing this developer's recent work and encourage engagement.\n"
-    )
-    if include_hashtags:
-        prompt += f"Add relevant hashtags at the end: {hashtags}\n"
+    prompt = _build_prompt(github_summary, repo_activity, include_hashtags)
 
     # Context management: Add prompt to context
     # Design: Track context usage to manage token limits
-    context_manager.add_context(
-        prompt,
-        role="user",
-        importance=9,  # High importance - this is the main request
-        metadata={"format_style": format_style, "tone": tone, "name": name},
-    )
+    if track_context:
+        context_manager.add_context(
+            prompt,
+            role="user",
+            importance=9,  # High importance - this is the main request
+            metadata={"format_style": format_style, "tone": tone, "name": name},
+        )
 
+    # Design: %-style args are only formatted when INFO logging is enabled
     log_event(
-        f"Gemini generation for '{name}' [{format_style}/{tone}] with {repos_count} repos. Prompt preview: {prompt[:150]}..."
+        "Gemini generation for '%s' [%s/%s] with %s repos. Prompt preview: %.150s...",
+        name,
+        format_style,
+        tone,
+        repos_count,
+        prompt,
     )
-    log_event(f"Context stats: {context_manager.get_context_stats()}")
+    if track_context:
+        log_event("Context stats: %s", context_manager.get_context_stats())
+
+    # Exact-match response cache: identical requests skip the API call
+    cache_key = _response_key(format_style, tone, prompt)
+    if use_cache:
+        content = _cached_response(cache_key)
+        if content is not None:
+            log_event("Gemini response cache hit for '%s'", name)
+            if track_context:
+                context_manager.add_context(
+                    content,
+                    role="assistant",
+                    importance=8,  # High importance - generated content
+                    metadata={"model": "cache", "format_style": format_style},
+                )
+            if on_chunk is not None:
+                on_chunk(content)
+            return {"content": content}
 
     # Model fallback mechanism
     # Design: Try models in order of preference to support both free and pro API tiers
@@ -139,39 +485,85 @@ def content_generator(
         "gemini-1.5-pro",  # Pro account model
     ]
 
+    # Start with the model that last worked and skip models known to be
+    # unavailable for this key (unless all are, then try them all again)
+    candidates = [name for name in model_names if name not in _dead_models]
+    if not candidates:
+        candidates = model_names
+    elif _preferred_model in candidates:
+        candidates.remove(_preferred_model)
+        candidates.insert(0, _preferred_model)
+
     last_error = None
+    streamed = False  # Whether any text has been passed to on_chunk
     # Try each model until one succeeds
-    for model_name in model_names:
+    for model_name in candidates:
         try:
-            model = genai.GenerativeModel(model_name)
-            log_event(f"Attempting to generate content with model: {model_name}")
+            model = _get_model(model_name, format_style, tone)
+            log_event("Attempting to generate content with model: %s", model_name)
             # Use context manager for prompt (if context is being used)
             # For now, use direct prompt, but context is tracked for future use
-            response = model.generate_content([prompt])
-            content = response.text
+            if on_chunk is None:
+                response = model.generate_content([prompt])
+                content = response.text
+            else:
+                # Stream: hand each chunk on as it arrives, keep the full text
+                response = model.generate_content([prompt], stream=True)
+                parts = []
+                for chunk in response:
+                    text = chunk.text
+                    if text:
+                        streamed = True
+                        parts.append(text)
+                        on_chunk(text)
+                content = "".join(parts)
+
+            # Log token usage for cost tracking
+            usage = getattr(response, "usage_metadata", None)
+            if usage is not None:
+                log_event(
+                    "Gemini token usage for %s: prompt=%s, output=%s",
+                    model_name,
+                    usage.prompt_token_count,
+                    getattr(usage, "candidates_token_count", 0),
+                )
 
             # Add response to context
-            context_manager.add_context(
-                content,
-                role="assistant",
-                importance=8,  # High importance - generated content
-                metadata={"model": model_name, "format_style": format_style},
-            )
+            if track_context:
+                context_manager.add_context(
+                    content,
+                    role="assistant",
+                    importance=8,  # High importance - generated content
+                    metadata={"model": model_name, "format_style": format_style},
+                )
 
             log_event(
-                f"Gemini generation success for '{name}' using {model_name}. Output preview: {content[:150]}..."
+                "Gemini generation success for '%s' using %s. "
+                "Output preview: %.150s...",
+                name,
+                model_name,
+                content,
             )
+            _preferred_model = model_name
+            _cache_response(cache_key, content)
             return {"content": content}
         except Exception as e:
             error_msg = str(e)
             error_type = type(e).__name__
             log_event(
-                f"Failed to generate with model {model_name}: {error_type}: {error_msg}"
+                "Failed to generate with model %s: %s: %s",
+                model_name,
+                error_type,
+                error_msg,
             )
             last_error = e
+            # Partial output was already streamed; another model would repeat it
+            if streamed:
+                break
             # If it's a model not found error, try next model
             # Design: Only retry on "not found" errors - other errors (quota, auth) are fatal
             if "not found" in error_msg.lower() or "404" in error_msg:
+                _dead_models.add(model_name)
                 continue
             # For other errors (quota, auth, etc.), don't try other models
             break
@@ -179,7 +571,7 @@ def content_generator(
     # If we get here, all models failed
     error_msg = str(last_error) if last_error else "Unknown error"
     error_type = type(last_error).__name__ if last_error else "Exception"
-    log_event(f"Gemini API error for '{name}': {error_type}: {error_msg}")
+    log_event("Gemini API error for '%s': %s: %s", name, error_type, error_msg)
 
     # Provide more detailed error information
     detailed_error = f"Gemini API error ({error_type}): {error_msg}"
@@ -192,3 +584,198 @@ def content_generator(
             model_names
         )
     return {"error": detailed_error}
+
+
+async def content_generator_async(
+    github_summary: dict,
+    repo_activity: Optional[dict] = None,
+    format_style: str = "LinkedIn",
+    tone: str = "professional",
+    include_hashtags: bool = True,
+    track_context: bool = True,
+    use_cache: bool = False,
+) -> dict:
+    """
+    Async variant of content_generator.
+
+    Design: Runs the blocking generation in a worker thread, keeping the
+    model fallback and caching logic in one place, so generation overlaps
+    with other awaited tools (e.g. GitHub fetches for another user).
+
+    Args:
+        github_summary (dict): Output from github_analyzer tool
+        repo_activity (dict, optional): Output from github_repo_activity tool
+        format_style (str): Content format - "LinkedIn", "Blog", or "README"
+        tone (str): Writing tone
+        include_hashtags (bool): Whether to include hashtags in the content
+        track_context (bool): Record prompt and response in the context manager
+        use_cache (bool): Reuse the post generated for an identical request
+
+    Returns:
+        dict: Same result as content_generator
+    """
+    return await asyncio.to_thread(
+        content_generator,
+        github_summary,
+        repo_activity,
+        format_style,
+        tone,
+        include_hashtags,
+        track_context,
+        use_cache,
+    )
+
+
+def _batch_errors(message: str, count: int) -> List[dict]:
+    """Build one error result per batch job (separate dicts per job)."""
+    return [{"error": message} for _ in range(count)]
+
+
+def content_generator_batch(
+    jobs: List[Dict],
+    poll_interval: float = 30.0,
+    timeout: float = 24 * 3600,
+    use_cache: bool = True,
+) -> List[dict]:
+    """
+    Generate content for many developers or variants with one Batch API job.
+
+    Use this for offline bulk work (e.g. refreshing many portfolios, or the
+    LinkedIn/Blog/README variants for one user); interactive requests should
+    keep using content_generator.
+
+    Design: Gemini's Batch API is billed at half the interactive price and
+    doesn't count against the per-minute limits, at the cost of latency
+    (jobs may take minutes to hours). The batch endpoints are only in the
+    google-genai client (installed with google-adk), so it is imported here.
+
+    Behavior:
+    - Serves jobs identical to an earlier generation from the response cache
+    - Builds one inline request per remaining job with the same prompt and
+      system instruction as content_generator
+    - Submits a single batch job and polls until it finishes or times out
+    - Returns one result per job, in input order
+
+    Args:
+        jobs (list): Dicts of content_generator keyword arguments
+            (github_summary, and optionally repo_activity, format_style,
+            tone, include_hashtags)
+        poll_interval (float): Seconds between job status checks
+        timeout (float): Maximum seconds to wait for the job
+        use_cache (bool): Reuse posts generated earlier for identical jobs
+            (on by default: bulk refreshes rarely want a new variant)
+
+    Returns:
+        list: Dictionaries with 'content' or 'error' key, one per job
+    """
+    results: List[Optional[dict]] = [None] * len(jobs)
+    # (job index, response cache key) for each request sent to the batch
+    submitted = []
+    inline_requests = []
+    # Build inline requests, sharing the interactive path's prompt layout
+    for index, job in enumerate(jobs):
+        format_style = job.get("format_style", "LinkedIn")
+        tone = job.get("tone", "professional")
+        prompt = _build_prompt(
+            job["github_summary"],
+            job.get("repo_activity"),
+            job.get("include_hashtags", True),
+        )
+        cache_key = _response_key(format_style, tone, prompt)
+        content = _cached_response(cache_key) if use_cache else None
+        if content is not None:
+            results[index] = {"content": content}
+            continue
+        submitted.append((index, cache_key))
+        inline_requests.append(
+            {
+                "contents": [{"role": "user", "parts": [{"text": prompt}]}],
+                "config": {"system_instruction": _system_prompt(format_style, tone)},
+            }
+        )
+
+    if inline_requests:
+        if len(submitted) < len(jobs):
+            log_event(
+                "Gemini batch: %s of %s jobs served from the response cache",
+                len(jobs) - len(submitted),
+                len(jobs),
+            )
+        batch_results = _submit_batch(inline_requests, poll_interval, timeout)
+        for (index, cache_key), result in zip(submitted, batch_results):
+            results[index] = result
+            if "content" in result:
+                _cache_response(cache_key, result["content"])
+    return results
+
+
+def _submit_batch(
+    inline_requests: List[dict], poll_interval: float, timeout: float
+) -> List[dict]:
+    """
+    Run inline requests as one Batch API job (see content_generator_batch).
+
+    Args:
+        inline_requests (list): Batch API inline requests
+        poll_interval (float): Seconds between job status checks
+        timeout (float): Maximum seconds to wait for the job
+
+    Returns:
+        list: Dictionaries with 'content' or 'error' key, one per request
+    """
+    count = len(inline_requests)
+    api_key = os.environ.get("GOOGLE_API_KEY")
+    if not api_key:
+        log_event("Gemini API key not found.")
+        return _batch_errors(
+            "Gemini API key not found in environment variables.", count
+        )
+
+    try:
+        from google import genai as genai_client
+    except ImportError:
+        log_event("Gemini batch generation unavailable: google-genai not installed")
+        return _batch_errors(
+            "Batch generation requires the google-genai package.", count
+        )
+
+    try:
+        client = genai_client.Client(api_key=api_key)
+        batch_job = client.batches.create(
+            model=BATCH_MODEL,
+            src=inline_requests,
+            config={"display_name": f"dpa-content-{time.time_ns()}"},
+        )
+        log_event(
+            "Gemini batch job %s submitted with %s requests", batch_job.name, count
+        )
+
+        # Poll until the job reaches a final state
+        deadline = time.monotonic() + timeout
+        while batch_job.state.name not in _BATCH_DONE_STATES:
+            if time.monotonic() >= deadline:
+                log_event("Gemini batch job %s timed out", batch_job.name)
+                return _batch_errors(
+                    f"Batch job {batch_job.name} did not finish in time.", count
+                )
+            time.sleep(poll_interval)
+            batch_job = client.batches.get(name=batch_job.name)
+    except Exception as e:
+        log_event("Gemini batch error: %s: %s", type(e).__name__, e)
+        return _batch_errors(
+            f"Gemini batch error ({type(e).__name__}): {str(e)}", count
+        )
+
+    state = batch_job.state.name
+    log_event("Gemini batch job %s finished: %s", batch_job.name, state)
+    if state != "JOB_STATE_SUCCEEDED":
+        return _batch_errors(f"Batch job {batch_job.name} ended in {state}.", count)
+
+    # Inline responses come back in request order
+    results = []
+    for inline_response in batch_job.dest.inlined_responses:
+        if inline_response.response is not None:
+            results.append({"content": inline_response.response.text})
+        else:
+            results.append({"error": f"Gemini batch error: {inline_response.error}"})
+    return results
@@ -6,9 +6,13 @@ It implements custom tools as required by the capstone project.
 
 Design Decisions:
 - Uses GitHub REST API for data fetching (no authentication required for public data)
+- Optional GITHUB_TOKEN enables a single GraphQL query for repo activity
 - Timeout handling prevents hanging requests
 - Structured error handling with detailed error messages
+- Short-lived cache of successful results, then ETag revalidation, to save
+  API rate limit
 - Logging integration for observability
+- Async variants run the blocking calls in worker threads so tools overlap
 
 Behavior:
 - Fetches public profile data from GitHub API
@@ -16,12 +20,217 @@ Behavior:
 - Returns structured data for content generation
 """
 
+import asyncio
+import copy
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Hashable, Optional, Tuple
+
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from ..utils.logging import log_event
+from ..utils.serialization import json_loads
+
+# Maximum number of commit histories fetched concurrently
+COMMIT_FETCH_WORKERS = 8
+
+# Shared HTTP session for all GitHub API calls
+# Design: Reuses pooled keep-alive connections to api.github.com, so only the
+# first request pays the TCP/TLS handshake; the pool is sized for the
+# concurrent commit fetches. Transient gateway errors are retried with a
+# short backoff
+_session = requests.Session()
+_session.headers.update(
+    {"Accept": "application/vnd.github+json", "User-Agent": "dpa-agent"}
+)
+_session.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=COMMIT_FETCH_WORKERS,
+        pool_maxsize=COMMIT_FETCH_WORKERS,
+        max_retries=Retry(
+            total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504]
+        ),
+    ),
+)
+
+# Response cache settings: GitHub profile data changes slowly, so results are
+# reused for a few minutes instead of re-hitting the (rate-limited) API
+CACHE_TTL_SECONDS = 300
+CACHE_MAX_ENTRIES = 1024
+
+# Successful tool results by (tool, args): key -> (expires_at, result)
+# Design: Insertion-ordered dict doubles as the eviction queue; expiry times
+# are time.monotonic() values so clock changes don't affect the TTL. Results
+# go in and out as deep copies (they are small): callers store them in
+# operation state, checkpoints and memory, and may mutate what they get, so
+# no two callers may share the cached object
+_cache: dict = {}
+_cache_lock = threading.Lock()
+
+
+def _cache_get(key: Hashable) -> Optional[Any]:
+    """
+    Return a cached result, or None if missing or expired.
+
+    Args:
+        key (Hashable): Cache key
+
+    Returns:
+        Any: Copy of the cached result, or None
+    """
+    with _cache_lock:
+        item = _cache.get(key)
+        if item is None:
+            return None
+        if item[0] < time.monotonic():
+            del _cache[key]
+            return None
+        value = item[1]
+    return copy.deepcopy(value)
+
+
+def _cache_put(key: Hashable, value: Any):
+    """
+    Store a result in the cache, evicting the oldest entry when full.
+
+    Args:
+        key (Hashable): Cache key
+        value (Any): Result to cache (a copy is stored)
+    """
+    value = copy.deepcopy(value)
+    with _cache_lock:
+        _cache.pop(key, None)
+        if len(_cache) >= CACHE_MAX_ENTRIES:
+            del _cache[next(iter(_cache))]
+        _cache[key] = (time.monotonic() + CACHE_TTL_SECONDS, value)
+
+
+# Last successful response per URL: url -> (etag, parsed JSON body)
+# Design: Once the TTL cache expires, requests are revalidated with
+# If-None-Match; GitHub answers 304 Not Modified without a body (and without
+# using rate-limit quota) when nothing changed, and the stored body is reused
+_etags: dict = {}
+_etags_lock = threading.Lock()
 
 
-def github_analyzer(username: str) -> dict:
+def _get_json(url: str) -> Tuple[int, Any]:
+    """
+    GET a GitHub API URL, revalidating a previous response by ETag.
+
+    Args:
+        url (str): API URL
+
+    Returns:
+        tuple: (status_code, parsed JSON body or None); a 304 revalidation is
+            reported as 200 with the stored body
+    """
+    with _etags_lock:
+        known = _etags.get(url)
+    headers = {"If-None-Match": known[0]} if known is not None else None
+
+    resp = _session.get(url, headers=headers, timeout=10)
+    if resp.status_code == 304 and known is not None:
+        return 200, known[1]
+    if resp.status_code != 200:
+        return resp.status_code, None
+
+    # Parse the raw body with the shared helper (orjson when installed)
+    data = json_loads(resp.content)
+    etag = resp.headers.get("ETag")
+    if etag:
+        with _etags_lock:
+            _etags.pop(url, None)
+            if len(_etags) >= CACHE_MAX_ENTRIES:
+                del _etags[next(iter(_etags))]
+            _etags[url] = (etag, data)
+    return 200, data
+
+
+# GraphQL query for github_repo_activity: the most recently updated public
+# repositories with their last three commits, in a single request
+_REPO_ACTIVITY_QUERY = """
+query($login: String!, $count: Int!) {
+  user(login: $login) {
+    repositories(
+      first: $count
+      ownerAffiliations: OWNER
+      privacy: PUBLIC
+      orderBy: {field: UPDATED_AT, direction: DESC}
+    ) {
+      nodes {
+        name
+        description
+        defaultBranchRef {
+          target {
+            ... on Commit {
+              history(first: 3) { nodes { message committedDate } }
+            }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+
+def _repo_activity_graphql(username: str, top_n: int, token: str) -> Optional[list]:
+    """
+    Fetch repository summaries for github_repo_activity via GraphQL.
+
+    Design: One request returns exactly the fields used, instead of one REST
+    call for the repo list plus one per repository. GitHub's GraphQL API
+    requires authentication, so this is only used when a token is available.
+
+    Args:
+        username (str): GitHub username
+        top_n (int): Number of repositories
+        token (str): GitHub access token
+
+    Returns:
+        list: Repository summaries in github_repo_activity's format, or None
+            if the query failed (the caller falls back to REST)
+    """
+    resp = _session.post(
+        "https://api.github.com/graphql",
+        json={
+            "query": _REPO_ACTIVITY_QUERY,
+            "variables": {"login": username, "count": top_n},
+        },
+        headers={"Authorization": f"Bearer {token}"},
+        timeout=10,
+    )
+    if resp.status_code != 200:
+        return None
+    user = (json_loads(resp.content).get("data") or {}).get("user")
+    if user is None:
+        return None
+
+    repo_summaries = []
+    for repo in user["repositories"]["nodes"]:
+        commits = []
+        branch = repo.get("defaultBranchRef")  # None for empty repositories
+        if branch and branch.get("target"):
+            commits = [
+                {"message": c["message"], "date": c["committedDate"]}
+                for c in branch["target"]["history"]["nodes"]
+            ]
+        repo_summaries.append(
+            {
+                "repo_name": repo["name"],
+                "description": repo.get("description"),
+                "commits": commits,
+            }
+        )
+    return repo_summaries
+
+
+def github_analyzer(username: str, use_cache: bool = True) -> dict:
     """
     Fetch basic public profile data from GitHub.
 
@@ -40,20 +249,29 @@ def github_analyzer(username: str) -> dict:
 
     Args:
         username (str): GitHub username to analyze
+        use_cache (bool): Return a recently cached result if available; when
+            False the profile is fetched again (and the cache refreshed)
 
     Returns:
         dict: Dictionary containing profile data, or error dictionary if failed
     """
-    log_event(f"Attempting GitHub analysis for username: {username}")
+    # Design: Successful results are cached for CACHE_TTL_SECONDS, so repeated
+    # agent invocations for the same user cost no API calls or quota
+    cache_key = ("github_analyzer", username)
+    cached = _cache_get(cache_key) if use_cache else None
+    if cached is not None:
+        log_event("GitHub analysis cache hit for username: %s", username)
+        return cached
+
+    log_event("Attempting GitHub analysis for username: %s", username)
 
     # GitHub REST API endpoint for user profile
     # Design: Using public API endpoint - no authentication needed for public profiles
     url = f"https://api.github.com/users/{username}"
     try:
         # Timeout prevents hanging if GitHub API is slow or unresponsive
-        resp = requests.get(url, timeout=10)
-        if resp.status_code == 200:
-            data = resp.json()
+        status_code, data = _get_json(url)
+        if status_code == 200:
             # Extract only relevant fields for portfolio generation
             # Design: Selective field extraction keeps data structure clean and focused
             result = {
@@ -64,17 +282,18 @@ def github_analyzer(username: str) -> dict:
                 "bio": data.get("bio"),
                 "profile_url": data.get("html_url"),
             }
-            log_event(f"GitHub analysis successful for {username}: {result}")
+            log_event("GitHub analysis successful for %s: %s", username, result)
+            _cache_put(cache_key, result)
             return result
         else:
             # Handle API errors (404 for not found, 403 for rate limits, etc.)
             log_event(
-                f"GitHub analysis API error for {username}: status {resp.status_code}"
+                "GitHub analysis API error for %s: status %s", username, status_code
             )
             return {"error": f"User '{username}' not found or API error."}
     except Exception as e:
         # Catch network errors, timeout errors, and other exceptions
-        log_event(f"GitHub analysis exception for {username}: {str(e)}")
+        log_event("GitHub analysis exception for %s: %s", username, e)
         return {"error": str(e)}
 
 
@@ -88,7 +307,8 @@ def github_repo_activity(username: str, top_n: int = 3) -> dict:
 
     Design: Fetches repositories sorted by update date, then fetches commit history
     for each repository. Limits to top N repositories and last 3 commits per repo
-    to keep data manageable and API calls reasonable.
+    to keep data manageable and API calls reasonable. With a GITHUB_TOKEN in the
+    environment, the same data comes from a single GraphQL query instead.
 
     Behavior:
     - Fetches list of public repositories sorted by last update
@@ -103,7 +323,32 @@ def github_repo_activity(username: str, top_n: int = 3) -> dict:
     Returns:
         dict: Dictionary containing repository summaries with commit history
     """
-    log_event(f"Fetching repo activity for username: {username} (top_n={top_n})")
+    # Successful results are cached like github_analyzer's
+    cache_key = ("github_repo_activity", username, top_n)
+    cached = _cache_get(cache_key)
+    if cached is not None:
+        log_event("Repo activity cache hit for username: %s", username)
+        return cached
+
+    log_event(
+        "Fetching repo activity for username: %s (top_n=%s)", username, top_n
+    )
+
+    # Single GraphQL round trip when authenticated, REST otherwise
+    token = os.environ.get("GITHUB_TOKEN")
+    if token:
+        try:
+            repo_summaries = _repo_activity_graphql(username, top_n, token)
+        except Exception as e:
+            log_event("GraphQL repo activity failed for %s: %s", username, e)
+            repo_summaries = None
+        if repo_summaries is not None:
+            log_event(
+                "Repo activity fetch complete for %s: %s", username, repo_summaries
+            )
+            result = {"repos": repo_summaries}
+            _cache_put(cache_key, result)
+            return result
 
     # GitHub API endpoint for user repositories
     # Design: Sort by 'updated' to get most recently active repositories
@@ -111,46 +356,98 @@ def github_repo_activity(username: str, top_n: int = 3) -> dict:
         f"https://api.github.com/users/{username}/repos?sort=updated&type=public"
     )
     try:
-        resp = requests.get(repos_url, timeout=10)
-        if resp.status_code != 200:
-            log_event(f"Repo fetch failed for {username}: status {resp.status_code}")
+        status_code, repos = _get_json(repos_url)
+        if status_code != 200:
+            log_event("Repo fetch failed for %s: status %s", username, status_code)
             return {"error": "Failed to fetch repos"}
 
         # Get top N most recently updated repositories
-        repos = resp.json()[:top_n]
+        repos = repos[:top_n]
         repo_summaries = []
 
-        # Analyze each repository
-        for repo in repos:
-            repo_name = repo["name"]
-            repo_desc = repo.get(
-                "description", ""
-            )  # Some repos may not have descriptions
-
-            # Fetch recent commits for this repository
-            # Design: Separate API call per repo to get commit history
-            commits_url = f"https://api.github.com/repos/{username}/{repo_name}/commits"
-            commits_resp = requests.get(commits_url, timeout=10)
-            commits = []
-
-            if commits_resp.status_code == 200:
-                # Extract last 3 commits with message and date
-                # Design: Limit to 3 commits to keep data focused and manageable
-                commits = [
+        # Fetch recent commits for all repositories concurrently
+        # Design: The commit fetches are independent and network-bound, so
+        # issuing them in parallel costs about one round trip instead of top_n
+        commits_urls = [
+            f"https://api.github.com/repos/{username}/{repo['name']}/commits"
+            for repo in repos
+        ]
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(COMMIT_FETCH_WORKERS, len(repos)))
+        ) as executor:
+            futures = [
+                executor.submit(_get_json, commits_url)
+                for commits_url in commits_urls
+            ]
+
+            # Analyze each repository (in the original order)
+            for repo, future in zip(repos, futures):
+                repo_name = repo["name"]
+                repo_desc = repo.get(
+                    "description", ""
+                )  # Some repos may not have descriptions
+
+                commits_status, commits_data = future.result()
+                commits = []
+
+                if commits_status == 200:
+                    # Extract last 3 commits with message and date
+                    # Design: Limit to 3 commits to keep data focused and manageable
+                    commits = [
+                        {
+                            "message": c["commit"]["message"],
+                            "date": c["commit"]["committer"]["date"],
+                        }
+                        for c in commits_data[:3]
+                    ]
+
+                # Build repository summary
+                repo_summaries.append(
                     {
-                        "message": c["commit"]["message"],
-                        "date": c["commit"]["committer"]["date"],
+                        "repo_name": repo_name,
+                        "description": repo_desc,
+                        "commits": commits,
                     }
-                    for c in commits_resp.json()[:3]
-                ]
-
-            # Build repository summary
-            repo_summaries.append(
-                {"repo_name": repo_name, "description": repo_desc, "commits": commits}
-            )
+                )
 
-        log_event(f"Repo activity fetch complete for {username}: {repo_summaries}")
-        return {"repos": repo_summaries}
+        log_event(
+            "Repo activity fetch complete for %s: %s", username, repo_summaries
+        )
+        result = {"repos": repo_summaries}
+        _cache_put(cache_key, result)
+        return result
     except Exception as e:
-        log_event(f"Repo activity error for {username}: {str(e)}")
+        log_event("Repo activity error for %s: %s", username, e)
         return {"error": str(e)}
+
+
+async def github_analyzer_async(username: str, use_cache: bool = True) -> dict:
+    """
+    Async variant of github_analyzer.
+
+    Design: Runs the blocking request in a worker thread (sharing the pooled
+    session and result cache), so an agent awaiting several tools overlaps
+    their network I/O instead of blocking the event loop.
+
+    Args:
+        username (str): GitHub username to analyze
+        use_cache (bool): Return a recently cached result if available
+
+    Returns:
+        dict: Same result as github_analyzer
+    """
+    return await asyncio.to_thread(github_analyzer, username, use_cache)
+
+
+async def github_repo_activity_async(username: str, top_n: int = 3) -> dict:
+    """
+    Async variant of github_repo_activity (see github_analyzer_async).
+
+    Args:
+        username (str): GitHub username
+        top_n (int): Number of top repositories to analyze (default: 3)
+
+    Returns:
+        dict: Same result as github_repo_activity
+    """
+    return await asyncio.to_thread(github_repo_activity, username, top_n)
@@ -12,7 +12,9 @@ Design Decisions:
 
 from typing import Optional, Any
 
-from ..long_running import OperationStatus, operation_manager
+# Design: Filter strings are validated with the shared value -> status dict
+# instead of constructing the enum and catching ValueError
+from ..long_running import _STATUS_BY_VALUE, operation_manager
 from ..utils.logging import log_event
 
 
@@ -64,7 +66,7 @@ def pause_operation(operation_id: str, checkpoint_data: Optional[dict] = None) -
         return {"error": f"Operation {operation_id} not found"}
 
     try:
-        op.pause(checkpoint_data)
+        operation_manager.pause_operation(operation_id, checkpoint_data)
         return {
             "operation_id": op.operation_id,
             "status": op.status.value,
@@ -92,11 +94,11 @@ def resume_operation(operation_id: str) -> dict:
         return {"error": f"Operation {operation_id} not found"}
 
     try:
-        state = op.resume()
+        state = operation_manager.resume_operation(operation_id)
         return {
             "operation_id": op.operation_id,
             "status": op.status.value,
-            "restored_state": state,
+            "restored_state": dict(state),  # Copy of the read-only view
         }
     except Exception as e:
         return {"error": str(e)}
@@ -138,11 +140,10 @@ def list_operations(status: Optional[str] = None) -> dict:
         dict: List of operations
     """
     if status:
-        try:
-            filter_status = OperationStatus(status)
-            operations = operation_manager.list_operations(filter_status)
-        except ValueError:
+        filter_status = _STATUS_BY_VALUE.get(status)
+        if filter_status is None:
             return {"error": f"Invalid status: {status}"}
+        operations = operation_manager.list_operations(filter_status)
     else:
         operations = operation_manager.list_operations()
 
@@ -17,10 +17,10 @@ Behavior:
 
 from typing import Optional
 
-from ..memory import memory_bank
-
 # Use shared memory bank instance
-# Design: Singleton pattern ensures all tools access the same memory
+# Design: Singleton pattern ensures all tools access the same memory. Importing
+# it is cheap: the bank reads its file on first query, not at construction
+from ..memory import memory_bank
 
 
 def get_history(username: Optional[str] = None) -> dict:
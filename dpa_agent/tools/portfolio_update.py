@@ -8,8 +8,11 @@ by chaining multiple tools together.
 Design Decisions:
 - Sequential workflow: GitHub analysis -> Content generation -> File writing
 - Error handling at each step prevents cascading failures
-- Integrates with memory bank to persist updates
+- Integrates with memory bank to persist updates (saved in the background,
+  so history reflects an update shortly after portfolio_update returns)
 - Uses evaluation system to track performance
+- Async variant overlaps the GitHub fetches of concurrent updates
+- Workflow modules are imported on first use to keep module import cheap
 
 Behavior:
 - Executes the complete portfolio update workflow
@@ -17,21 +20,41 @@ Behavior:
 - Returns comprehensive results including all intermediate steps
 """
 
+import asyncio
+import atexit
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
-from ..a2a_protocol import MessageType, a2a_protocol
-from ..evaluation import get_evaluator
-from ..long_running import OperationStatus, operation_manager
-from ..memory import memory_bank
 from ..utils.logging import log_event
-from .content_generator import content_generator
-from .github_analyzer import github_analyzer
 from .portfolio_writer import portfolio_writer
 
+# Maximum number of concurrent GitHub fetches from portfolio_update_async
+# Design: Keeps bursts of updates within GitHub's rate limits
+GITHUB_FETCH_CONCURRENCY = 10
+
+_github_fetch_slots = threading.BoundedSemaphore(GITHUB_FETCH_CONCURRENCY)
+
+# Serializes the workflow steps run by portfolio_update_async
+# Design: Content generation, evaluation and memory persistence share
+# process-wide state (context manager, evaluator, memory bank) that isn't
+# thread-safe, so only the GitHub fetches of concurrent updates overlap
+_workflow_lock = threading.Lock()
+
+# Background writer for memory bank saves
+# Design: The caller only needs the returned result, so the save runs off
+# the critical path. A single worker keeps saves in submission order; pending
+# saves are completed at exit
+_save_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="memory-save")
+atexit.register(_save_executor.shutdown, wait=True)
+
 
 def portfolio_update(
-    username: str, operation_id: Optional[str] = None, resume: bool = False
+    username: str,
+    operation_id: Optional[str] = None,
+    resume: bool = False,
+    no_cache: bool = False,
 ) -> dict:
     """
     Orchestrate the complete portfolio update workflow.
@@ -50,28 +73,106 @@ def portfolio_update(
     1. Analyzes GitHub profile and repositories
     2. Generates portfolio content using Gemini
     3. Writes content to markdown file
-    4. Saves update to persistent memory
+    4. Saves update to persistent memory (on a background thread)
     5. Records metrics for evaluation
 
+    Memory is eventually consistent: the save may still be pending when this
+    returns, so get_history called right afterwards can miss the new entry.
+    portfolio_update_async waits for the save before returning.
+
     Args:
         username (str): GitHub username to update portfolio for
         operation_id (str, optional): Operation ID for long-running operation tracking
-        resume (bool): Whether to resume a paused operation
+        resume (bool): Whether to resume a paused operation; otherwise
+            operation_id starts a new operation, replacing any with that ID
+        no_cache (bool): Fetch the GitHub profile again instead of reusing a
+            result cached by github_analyzer in the last few minutes
 
     Returns:
         dict: Complete workflow results including all intermediate steps
     """
-    start_time = time.time()
+    return _portfolio_update(username, operation_id, resume, no_cache)
+
+
+def _portfolio_update(
+    username: str,
+    operation_id: Optional[str],
+    resume: bool,
+    no_cache: bool,
+    github_summary: Optional[dict] = None,
+) -> dict:
+    """
+    Run portfolio_update, optionally with a GitHub summary fetched beforehand.
+
+    Args:
+        username (str): GitHub username to update portfolio for
+        operation_id (str, optional): Operation ID for long-running operation tracking
+        resume (bool): Whether to resume a paused operation
+        no_cache (bool): Bypass github_analyzer's cache when fetching
+        github_summary (dict, optional): github_analyzer result to use instead
+            of fetching (ignored when resuming from a checkpoint)
+
+    Returns:
+        dict: Same result as portfolio_update
+    """
+    # Design: The workflow modules (HTTP client, LLM wrapper, storage
+    # singletons) are imported on first use, so importing this module stays
+    # cheap; later calls only hit the sys.modules cache
+    from ..evaluation import get_evaluator
+    from ..memory import memory_bank
+
+    # Evaluator for all metrics recorded below (resolved once per update)
+    evaluator = get_evaluator(memory_bank)
+    # Design: Step outcomes are collected as (operation_type, success,
+    # execution_time) tuples and recorded in one batch when the workflow
+    # ends, including early returns and exceptions
+    operations = []
+    try:
+        return _run_portfolio_update(
+            username,
+            operation_id,
+            resume,
+            no_cache,
+            github_summary,
+            evaluator,
+            operations,
+        )
+    finally:
+        evaluator.record_operations(operations)
+
+
+def _run_portfolio_update(
+    username: str,
+    operation_id: Optional[str],
+    resume: bool,
+    no_cache: bool,
+    github_summary: Optional[dict],
+    evaluator,
+    operations: list,
+) -> dict:
+    """Run the portfolio_update steps, appending step outcomes to operations."""
+    from ..long_running import OperationStatus, operation_manager
+    from ..memory import memory_bank
+    from .content_generator import content_generator
+    from .github_analyzer import github_analyzer
+
+    # Design: perf_counter is monotonic, so step timings recorded for
+    # evaluation can't go negative or jump when the system clock is adjusted
+    start_time = time.perf_counter()
 
     # Long-running operation support
+    # Design: Status changes go through operation_manager so each one is
+    # journaled (and final states written) instead of only changing in memory
     if operation_id:
-        op = operation_manager.get_operation(operation_id)
-        if resume and op and op.status == OperationStatus.PAUSED:
+        # Design: Only a resume needs the existing operation; a new run skips
+        # the lookup and creates its operation directly
+        op = operation_manager.get_operation(operation_id) if resume else None
+        if op and op.status == OperationStatus.PAUSED:
             # Resume from checkpoint
-            state = op.resume()
+            state = operation_manager.resume_operation(operation_id)
             summary = state.get("github_summary")
             log_event(
-                f"Resuming portfolio_update operation {operation_id} for {username}"
+                "Resuming portfolio_update operation %s for %s", operation_id, username
             )
         else:
             # Create or get operation
@@ -79,81 +180,100 @@ def portfolio_update(
                 op = operation_manager.create_operation(
                     operation_id, "portfolio_update", {"username": username}
                 )
-            op.start()
+            operation_manager.start_operation(operation_id)
             summary = None
     else:
         op = None
         summary = None
 
-    log_event(f"Running portfolio_update for username: {username}")
+    log_event("Running portfolio_update for username: %s", username)
 
     # Step 1: Analyze GitHub profile and repositories
-    # Design: First step gathers all necessary data for content generation
+    # Design: First step gathers all necessary data for content generation.
+    # Reruns for the same user within the cache TTL reuse the fetched profile
     if not summary:
-        summary = github_analyzer(username)
+        summary = github_summary
+        if summary is None:
+            summary = github_analyzer(username, use_cache=not no_cache)
         if op:
+            # Checkpoint after GitHub analysis (the pause journals the new
+            # state), then carry on with the next step
             op.update_state("github_summary", summary)
-            op.pause(
-                {"step": "github_analysis_complete"}
-            )  # Checkpoint after GitHub analysis
-    if "error" in summary:
-        log_event(f"GitHub analysis failed for {username}: {summary['error']}")
+            operation_manager.pause_operation(
+                operation_id, {"step": "github_analysis_complete"}
+            )
+            operation_manager.resume_operation(operation_id)
+    err = summary.get("error")
+    if err:
+        log_event("GitHub analysis failed for %s: %s", username, err)
+        if op:
+            operation_manager.fail_operation(
+                operation_id, f"GitHub analysis failed: {err}"
+            )
         # Record failure for evaluation
-        evaluator = get_evaluator(memory_bank)
-        evaluator.record_operation("github_analyzer", False, time.time() - start_time)
-        return {"error": f"GitHub analysis failed: {summary['error']}"}
-    log_event(f"GitHub analysis succeeded for {username}")
+        operations.append(("github_analyzer", False, time.perf_counter() - start_time))
+        return {"error": f"GitHub analysis failed: {err}"}
+    log_event("GitHub analysis succeeded for %s", username)
 
     # Record success for evaluation
-    evaluator = get_evaluator(memory_bank)
-    evaluator.record_operation("github_analyzer", True, time.time() - start_time)
+    operations.append(("github_analyzer", True, time.perf_counter() - start_time))
 
     # Step 2: Generate portfolio content using Gemini
     # Design: Content generation depends on successful GitHub analysis
-    content_start = time.time()
-    post = content_generator(summary)
+    content_start = time.perf_counter()
+    # Design: Reruns of an unchanged profile reuse the post generated before
+    # (the tool itself generates a fresh variant by default)
+    post = content_generator(summary, use_cache=True)
     if op:
         op.update_state("generated_post", post)
-        op.pause(
-            {"step": "content_generation_complete"}
+        operation_manager.pause_operation(
+            operation_id, {"step": "content_generation_complete"}
         )  # Checkpoint after content generation
-    if "error" in post:
-        log_event(f"Content generation failed for {username}: {post['error']}")
-        evaluator.record_operation(
-            "content_generator", False, time.time() - content_start
+    err = post.get("error")
+    if err:
+        log_event("Content generation failed for %s: %s", username, err)
+        if op:
+            operation_manager.fail_operation(
+                operation_id, f"Content generation failed: {err}"
+            )
+        operations.append(
+            ("content_generator", False, time.perf_counter() - content_start)
         )
-        return {"error": f"Content generation failed: {post['error']}"}
-    log_event(f"Content generation succeeded for {username}")
+        return {"error": f"Content generation failed: {err}"}
+    log_event("Content generation succeeded for %s", username)
 
     # Evaluate content quality
     content = post.get("content", "") or post.get("linkedin_post", "")
     if content:
         quality_metrics = evaluator.evaluate_content_quality(content)
-        log_event(f"Content quality score: {quality_metrics['score']}/100")
-        evaluator.record_operation(
-            "content_generator", True, time.time() - content_start
+        log_event("Content quality score: %s/100", quality_metrics["score"])
+        operations.append(
+            ("content_generator", True, time.perf_counter() - content_start)
         )
 
     # Step 3: Write content to markdown file
     # Design: File writing is the final step, only proceeds if content was generated
     if not content:
-        log_event(f"No content produced for {username}!")
+        log_event("No content produced for %s!", username)
+        if op:
+            operation_manager.fail_operation(operation_id, "No content produced")
         return {"error": "No content available for portfolio writing."}
 
-    write_start = time.time()
+    write_start = time.perf_counter()
     file_result = portfolio_writer(content)
-    log_event(f"portfolio_writer result for {username}: {file_result}")
+    log_event("portfolio_writer result for %s: %s", username, file_result)
 
     # Record file writing operation
     write_success = file_result.get("status") == "success"
-    evaluator.record_operation(
-        "portfolio_writer", write_success, time.time() - write_start
+    operations.append(
+        ("portfolio_writer", write_success, time.perf_counter() - write_start)
     )
 
-    # Save to persistent memory
+    # Save to persistent memory (in the background, see _save_executor)
     # Design: Memory persistence allows agent to recall past updates
     if write_success and content:
-        memory_bank.save(
+        _save_executor.submit(
+            memory_bank.save,
             username=username,
             post=content,
             meta={
@@ -162,19 +282,22 @@ def portfolio_update(
                 "quality_score": quality_metrics.get("score", 0) if content else 0,
             },
         )
-        log_event(f"Portfolio update saved to memory for {username}")
+        log_event("Portfolio update queued for saving to memory for %s", username)
 
-    total_time = time.time() - start_time
-    log_event(f"Portfolio update completed for {username} in {total_time:.2f} seconds")
+    total_time = time.perf_counter() - start_time
+    log_event(
+        "Portfolio update completed for %s in %.2f seconds", username, total_time
+    )
 
-    # Complete long-running operation if it exists
+    # Complete long-running operation if it exists (persisted immediately)
     if op:
-        op.complete(
+        operation_manager.complete_operation(
+            operation_id,
             {
                 "github_summary": summary,
                 "generated_post": post,
                 "file_result": file_result,
-            }
+            },
         )
 
     return {
@@ -184,3 +307,73 @@ def portfolio_update(
         "execution_time": round(total_time, 2),
         "operation_id": op.operation_id if op else None,
     }
+
+
+def _prefetch_github_summary(username: str, use_cache: bool) -> dict:
+    """Fetch a profile with github_analyzer, bounded by the fetch slots."""
+    from .github_analyzer import github_analyzer
+
+    with _github_fetch_slots:
+        return github_analyzer(username, use_cache)
+
+
+def _serialized_portfolio_update(
+    username: str,
+    operation_id: Optional[str],
+    resume: bool,
+    no_cache: bool,
+    github_summary: Optional[dict],
+) -> dict:
+    """Run portfolio_update while holding the workflow lock."""
+    with _workflow_lock:
+        return _portfolio_update(
+            username, operation_id, resume, no_cache, github_summary
+        )
+
+
+async def portfolio_update_async(
+    username: str,
+    operation_id: Optional[str] = None,
+    resume: bool = False,
+    no_cache: bool = False,
+) -> dict:
+    """
+    Async variant of portfolio_update for updating many users concurrently.
+
+    Design: The workflow steps depend on each other, so a single update can't
+    run them in parallel; across users, though, the GitHub fetches are
+    independent. Each call first fetches the profile in a worker thread (at
+    most GITHUB_FETCH_CONCURRENCY at a time), then runs the workflow under a
+    lock with the fetched summary, so the analysis isn't repeated there.
+    Gathering several calls overlaps their GitHub round trips without
+    blocking the event loop.
+
+    Args:
+        username (str): GitHub username to update portfolio for
+        operation_id (str, optional): Operation ID for long-running operation tracking
+        resume (bool): Whether to resume a paused operation; otherwise
+            operation_id starts a new operation, replacing any with that ID
+        no_cache (bool): Fetch the GitHub profile again (see portfolio_update)
+
+    Returns:
+        dict: Same result as portfolio_update, with the memory save finished
+    """
+    # The fetched summary (or error) is handed to the workflow directly
+    summary = None
+    if not resume:  # A resumed operation already has its GitHub summary
+        summary = await asyncio.to_thread(
+            _prefetch_github_summary, username, not no_cache
+        )
+    result = await asyncio.to_thread(
+        _serialized_portfolio_update,
+        username,
+        operation_id,
+        resume,
+        no_cache,
+        summary,
+    )
+    # Read-after-write for async callers: the save worker runs jobs in order,
+    # so once a no-op queued behind this update's save has run, the update
+    # is in memory
+    await asyncio.wrap_future(_save_executor.submit(lambda: None))
+    return result
@@ -16,10 +16,16 @@ Behavior:
 - Logs all file operations for traceability
 """
 
+import contextlib
+import os
+import tempfile
+
 from ..utils.logging import log_event
 
 
-def portfolio_writer(content: str, filename: str = "portfolio_entry.md") -> dict:
+def portfolio_writer(
+    content: str, filename: str = "portfolio_entry.md", sync: bool = False
+) -> dict:
     """
     Saves generated content to a markdown file.
 
@@ -32,14 +38,18 @@ def portfolio_writer(content: str, filename: str = "portfolio_entry.md") -> dict
     supporting customization.
 
     Behavior:
-    - Opens file in write mode with UTF-8 encoding
-    - Writes content to file
+    - Encodes content as UTF-8
+    - Writes the bytes to a unique temporary sibling file with a raw
+      OS-level write
+    - Atomically replaces the target file, so readers never see a partial entry
     - Returns success/error status
     - Logs operation for observability
 
     Args:
         content (str): Portfolio content to write to file
         filename (str): Output filename (default: portfolio_entry.md)
+        sync (bool): fsync the data before publishing it, for callers that
+            need the entry durable on disk (off by default: slower)
 
     Returns:
         dict: Dictionary with 'status' ('success' or 'error') and additional info
@@ -48,8 +58,37 @@ def portfolio_writer(content: str, filename: str = "portfolio_entry.md") -> dict
         # Write content with UTF-8 encoding
         # Design: UTF-8 encoding ensures proper handling of international characters
         # and emojis that may appear in generated content
-        with open(filename, "w", encoding="utf-8") as f:
-            f.write(content)
+        data = content.encode("utf-8")
+        # Design: Write a temporary file and os.replace it over the target
+        # (atomic on POSIX and Windows), so a crash mid-write leaves the
+        # previous entry intact instead of a truncated file. mkstemp gives
+        # each call its own temp file, so concurrent writers of the same
+        # entry never share one; the last replace wins
+        fd, tmp_filename = tempfile.mkstemp(
+            dir=os.path.dirname(filename) or ".",
+            prefix=os.path.basename(filename),
+            suffix=".tmp",
+        )
+        try:
+            # Design: A single raw write of the encoded bytes instead of a
+            # text-mode file object (text wrapper, buffer, incremental encoder)
+            # for one write (mkstemp opens in binary mode: no newline
+            # translation on Windows, same bytes everywhere)
+            try:
+                os.chmod(tmp_filename, 0o644)  # mkstemp creates it owner-only
+                view = memoryview(data)
+                while view:  # os.write may write less than requested
+                    view = view[os.write(fd, view) :]
+                if sync:
+                    os.fsync(fd)
+            finally:
+                os.close(fd)
+            os.replace(tmp_filename, filename)
+        except BaseException:
+            # Don't leave the temp file behind if the write or replace failed
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(tmp_filename)
+            raise
         log_event(f"Portfolio entry saved to {filename} (success).")
         return {"status": "success", "file": filename}
     except Exception as e:
@@ -1,5 +1,6 @@
 """Utility functions for the DPA agent."""
 
 from .logging import log_event
+from .serialization import json_dumps, json_loads
 
-__all__ = ["log_event"]
+__all__ = ["log_event", "json_dumps", "json_loads"]
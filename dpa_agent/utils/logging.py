@@ -9,6 +9,7 @@ Design Decisions:
 - Emoji removal for console compatibility (Windows cp1252 encoding issues)
 - Centralized configuration ensures consistent logging across all modules
 - Force=True overrides any existing logging configuration
+- Buffered file writes (flushed per batch, on errors and at exit)
 
 Behavior:
 - Logs all events to portfolio_agent.log file
@@ -16,21 +17,52 @@ Behavior:
 - Provides safe logging function that handles Unicode gracefully
 """
 
+import atexit
 import logging
+import logging.handlers
 import re
-import sys
+
+# Number of log records buffered before they are written to the file
+LOG_BUFFER_CAPACITY = 64
 
 # Configure logging with UTF-8 encoding for file handler
 # Design: UTF-8 encoding ensures proper handling of international characters
+_file_handler = logging.FileHandler("portfolio_agent.log", encoding="utf-8")
+_file_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
+
+# Design: Records are buffered and written in batches of LOG_BUFFER_CAPACITY,
+# so a chatty workflow pays one lock-and-write per batch instead of per event.
+# ERROR records flush immediately, and the buffer is flushed at exit; a hard
+# crash can lose at most one unflushed batch
+_memory_handler = logging.handlers.MemoryHandler(
+    LOG_BUFFER_CAPACITY, flushLevel=logging.ERROR, target=_file_handler
+)
+atexit.register(_memory_handler.flush)
+
 # Force=True ensures our configuration overrides any existing logging setup
 logging.basicConfig(
     level=logging.INFO,
-    filename="portfolio_agent.log",
-    format="%(asctime)s %(levelname)s %(message)s",
-    encoding="utf-8",
+    handlers=[_memory_handler],
     force=True,  # Override any existing configuration
 )
 
+# Logger used by log_event; records propagate to the root handlers above
+_logger = logging.getLogger("dpa")
+
+# Emoji and other problematic Unicode ranges, compiled once at import
+# Design: Comprehensive emoji Unicode ranges cover most common emojis
+_EMOJI_RE = re.compile(
+    "["
+    "\U0001f600-\U0001f64f"  # emoticons
+    "\U0001f300-\U0001f5ff"  # symbols & pictographs
+    "\U0001f680-\U0001f6ff"  # transport & map symbols
+    "\U0001f1e0-\U0001f1ff"  # flags (iOS)
+    "\U00002702-\U000027b0"
+    "\U000024c2-\U0001f251"
+    "]+",
+    flags=re.UNICODE,
+)
+
 
 # Remove emojis and other problematic Unicode characters for safe logging
 def remove_emojis(text):
@@ -43,9 +75,13 @@ def remove_emojis(text):
 
     Design: Uses regex pattern matching to identify and remove emoji Unicode
     ranges. This approach is more efficient than character-by-character checking.
+    The pattern is compiled once at module import, not per call, and pure-ASCII
+    text (most log lines) skips the regex entirely: str.isascii() is a
+    constant-time flag check on CPython strings.
 
     Behavior:
     - Converts input to string if needed
+    - Returns ASCII text unchanged (it cannot contain emojis)
     - Removes emoji Unicode ranges using regex
     - Returns cleaned text safe for cp1252 encoding
 
@@ -57,23 +93,13 @@ def remove_emojis(text):
     """
     if not isinstance(text, str):
         text = str(text)
+    if text.isascii():
+        return text
     # Remove emojis and other non-printable Unicode characters
-    # Design: Comprehensive emoji Unicode ranges cover most common emojis
-    emoji_pattern = re.compile(
-        "["
-        "\U0001f600-\U0001f64f"  # emoticons
-        "\U0001f300-\U0001f5ff"  # symbols & pictographs
-        "\U0001f680-\U0001f6ff"  # transport & map symbols
-        "\U0001f1e0-\U0001f1ff"  # flags (iOS)
-        "\U00002702-\U000027b0"
-        "\U000024c2-\U0001f251"
-        "]+",
-        flags=re.UNICODE,
-    )
-    return emoji_pattern.sub("", text)
-
-
-def log_event(event):
+    return _EMOJI_RE.sub("", text)
+
+
+def log_event(event, *args):
     """
     Log an event, safely handling Unicode characters including emojis.
 
@@ -83,9 +109,13 @@ def log_event(event):
 
     Design: Centralized logging function ensures consistent behavior
     across all modules. Emoji removal prevents console encoding errors
-    while file logs preserve full Unicode (UTF-8).
+    while file logs preserve full Unicode (UTF-8). Like the stdlib logging
+    calls, %-style args are only formatted when INFO logging is enabled, so
+    hot paths pay nothing for disabled logging.
 
     Behavior:
+    - Returns immediately if INFO logging is disabled
+    - Formats event % args if args are given
     - Converts event to string if needed
     - Removes emojis for console compatibility
     - Logs to file with full Unicode support
@@ -93,12 +123,21 @@ def log_event(event):
 
     Args:
         event: Event to log (will be converted to string)
+        *args: Optional %-format arguments for event
     """
+    # Skip all formatting work when the message would be discarded anyway
+    # (isEnabledFor results are cached per logger)
+    if not _logger.isEnabledFor(logging.INFO):
+        return
+
     # Convert to string if needed
-    if not isinstance(event, str):
+    if args:
+        event = event % args
+    elif not isinstance(event, str):
         event = str(event)
 
     # Remove emojis to prevent encoding errors on Windows console
-    # Design: File logs use UTF-8 and preserve emojis, console logs are cleaned
+    # Design: File logs use UTF-8 and preserve emojis, console logs are cleaned.
+    # remove_emojis returns ASCII events (the common case) unchanged
     safe_event = remove_emojis(event)
-    logging.info(safe_event)
+    _logger.info(safe_event)
@@ -0,0 +1,59 @@
+"""
+JSON Serialization Utility Module
+
+This module provides JSON encoding/decoding helpers shared by the agent modules.
+
+Design Decisions:
+- Uses orjson when it is installed (several times faster than stdlib json)
+- Falls back to the standard library json module so orjson stays optional
+- Returns str from json_dumps in both cases so callers don't care which is used
+- Compact output (no whitespace) unless indent is requested, matching orjson
+
+Behavior:
+- json_dumps serializes Python objects, optionally pretty-printed
+- json_loads parses str or bytes input
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
+
+def json_dumps(obj, indent: bool = False) -> str:
+    """
+    Serialize an object to a JSON string.
+
+    Args:
+        obj: JSON-serializable object
+        indent (bool): Pretty-print with 2-space indentation
+
+    Returns:
+        str: JSON document
+    """
+    if orjson is not None:
+        # Allow non-str dict keys like the stdlib encoder does
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option).decode("utf-8")
+    if indent:
+        return json.dumps(obj, indent=2)
+    return json.dumps(obj, separators=(",", ":"))
+
+
+def json_loads(data):
+    """
+    Parse a JSON document.
+
+    Args:
+        data (str | bytes): JSON document
+
+    Returns:
+        Any: Parsed object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)